@@ -1,3 +1,5 @@
+import functools
+import hashlib
 import os
 import re
 import shutil
@@ -16,8 +18,6 @@ from setuptools.command.build_py import build_py
 
 from typing import Any
 
-os.environ["CYTHON_FORCE_REGEN"] = "1"  # Slower but safer when moving submodules - always re-cythonize https://cython.readthedocs.io/en/latest/src/changes.html#alpha-11-2022-07-31
-
 LINK_MODE = os.getenv("BAREDUCKDB_LINK_MODE", "dynamic")  # Dynamic linking against prebuilt .so
 OPTIMIZATION_LEVEL = os.getenv("BAREDUCKDB_OPTIMIZATION", "balanced")
 
@@ -67,6 +67,61 @@ def setup_compiler_cache():
 
     return compiler_launcher
 
+_COMPILER_CHECK_CACHE = Path(os.path.dirname(__file__)) / "build" / ".compiler_check"
+
+
+def _parse_version_output(version_output):
+    # Parse version - works for both GCC and Clang masquerading as g++
+    # GCC format: "g++ (GCC) 14.2.1 ..."
+    # Clang format: "Apple clang version 15.0.0 ..."
+    match = re.search(r'(?:gcc|g\+\+).*?(\d+)\.(\d+)', version_output, re.IGNORECASE)
+    if not match:
+        # Try Clang format
+        match = re.search(r'clang version (\d+)\.(\d+)', version_output, re.IGNORECASE)
+    if not match:
+        return None
+    return f"{match.group(1)}.{match.group(2)}"
+
+
+def get_compiler_version(cxx):
+    """
+    Returns the compiler version as "major.minor[.patch]", or None if it can't be determined.
+
+    Cached in build/.compiler_check, keyed by the resolved compiler path and its mtime,
+    so repeated setup.py invocations skip the subprocess.
+    """
+    cache_key = None
+    cxx_path = shutil.which(cxx)
+    if cxx_path:
+        cxx_real = os.path.realpath(cxx_path)
+        cache_key = f"{cxx_real}:{os.path.getmtime(cxx_real)}"
+        try:
+            cached_key, cached_version = _COMPILER_CHECK_CACHE.read_text().splitlines()
+            if cached_key == cache_key:
+                return cached_version
+        except (OSError, ValueError):
+            pass
+
+    try:
+        # GCC prints just the version, e.g. "14.2.1"
+        result = subprocess.run([cxx, "-dumpfullversion", "-dumpversion"], capture_output=True, text=True, check=True)
+        version = result.stdout.strip()
+        if not re.fullmatch(r'\d+(\.\d+)+', version):
+            raise ValueError(version)
+    except (subprocess.CalledProcessError, ValueError):
+        result = subprocess.run([cxx, "--version"], capture_output=True, text=True, check=True)
+        version = _parse_version_output(result.stdout)
+        if version is None:
+            print(f"Warning: Could not parse compiler version from: {result.stdout}")
+            return None
+
+    if cache_key:
+        _COMPILER_CHECK_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _COMPILER_CHECK_CACHE.write_text(f"{cache_key}\n{version}\n")
+
+    return version
+
+
 def check_gcc_version(*, compiler_launcher, min_major=14, min_minor=0):
     """
     Note: This version is somewhat arbitrary: I used some new build flags from 14.0.
@@ -85,41 +140,42 @@ def check_gcc_version(*, compiler_launcher, min_major=14, min_minor=0):
     if compiler_launcher and cxx.startswith(compiler_launcher):
         cxx = cxx.split()[-1]
 
-    try:
-        # Get version from compiler
-        result = subprocess.run(
-            [cxx, "--version"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        version_output = result.stdout
+    version = get_compiler_version(cxx)
+    if version is None:
+        print("Proceeding anyway")
+        return
 
-        # Parse version - works for both GCC and Clang masquerading as g++
-        # GCC format: "g++ (GCC) 14.2.1 ..."
-        # Clang format: "Apple clang version 15.0.0 ..."
-        match = re.search(r'(?:gcc|g\+\+).*?(\d+)\.(\d+)', version_output, re.IGNORECASE)
-        if not match:
-            # Try Clang format
-            match = re.search(r'clang version (\d+)\.(\d+)', version_output, re.IGNORECASE)
+    major, minor = (int(part) for part in version.split(".")[:2])
 
-        if not match:
-            print(f"Warning: Could not parse compiler version from: {version_output}")
-            print("Proceeding anyway")
-            return
+    if major < min_major or (major == min_major and minor < min_minor):
+        raise RuntimeError(f"Failed compiler version check {major=}, {minor=}")
 
-        major = int(match.group(1))
-        minor = int(match.group(2))
 
-        if major < min_major or (major == min_major and minor < min_minor):
-            raise RuntimeError(f"Failed compiler version check {major=}, {minor=}")
 
-    except Exception as e:
-        raise e
+# DuckDB auto-download
+def _download_and_extract(url, target_dir):
+    zip_path = target_dir / "libduckdb.zip"
 
+    ua = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36"
+    for attempt in range(2):
+        try:
+            # Add User-Agent header to avoid Cloudflare 403 errors
+            req = urllib.request.Request(url, headers={'User-Agent': ua})
+            with urllib.request.urlopen(req, timeout=30) as response:
+                with open(zip_path, 'wb') as f:
+                    f.write(response.read())
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                zip_ref.extractall(target_dir)
+            break
+        except Exception as e:
+            if attempt:
+                raise
+            print(f"Failed to download from {url}, retrying once: {e}")
+            time.sleep(2)
+
+    zip_path.unlink()
 
 
-# DuckDB auto-download
 def download_and_extract_duckdb():
     # TODO: Support nightlys
 
@@ -136,32 +192,34 @@ def download_and_extract_duckdb():
     else:
         raise RuntimeError(f"Unsupported platform: {sys.platform}")
 
+    import fcntl
+
     _DUCKDB_LIB_DIR_PATH.mkdir(exist_ok=True)
-    
-    # Download to temporary file
-    zip_path = _DUCKDB_LIB_DIR_PATH / "libduckdb.zip"
 
-    ua = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36"
-    try:
-        # Add User-Agent header to avoid Cloudflare 403 errors
-        req = urllib.request.Request(url, headers={'User-Agent': ua})
-        with urllib.request.urlopen(req, timeout=30) as response:
-            with open(zip_path, 'wb') as f:
-                f.write(response.read())
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(_DUCKDB_LIB_DIR)
-    except Exception as e:
-        print(f"Failed to download from {url}, retrying once: {e}")
-        time.sleep(2)
-        req = urllib.request.Request(url, headers={'User-Agent': ua})
-        with urllib.request.urlopen(req, timeout=30) as response:
-            with open(zip_path, 'wb') as f:
-                f.write(response.read())
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(_DUCKDB_LIB_DIR)
+    # Concurrent setup.py runs (CI matrices, tox -p) serialize here, so only one process downloads
+    with open(_DUCKDB_LIB_DIR_PATH / "libduckdb.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            if _DUCKDB_SHARED_LIB_PATH.exists():
+                print(f"{_DUCKDB_SHARED_LIB=} was extracted by another process")
+                return
+
+            # Extract next to the target, then move files in: the shared lib goes last, since its existence marks completion
+            tmp_dir = _DUCKDB_LIB_DIR_PATH.with_name(f"{_DUCKDB_LIB_DIR_NAME}.tmp.{os.getpid()}")
+            tmp_dir.mkdir()
+            try:
+                _download_and_extract(url, tmp_dir)
+                extracted = sorted(tmp_dir.iterdir(), key=lambda path: path.name == _DUCKDB_SHARED_LIB_PATH.name)
+                for path in extracted:
+                    os.replace(path, _DUCKDB_LIB_DIR_PATH / path.name)
+            finally:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
     assert _DUCKDB_SHARED_LIB_PATH.exists()
 
-    print(f"Downloaded & extracted successfully: {zip_path=}")
+    print(f"Downloaded & extracted successfully: {url=}")
 
 
 
@@ -302,11 +360,9 @@ print(f"Link args: {' '.join(link_args)}")
 
 # Core extensions - only dependency is duckdb
 
-def get_args(name, sources) -> dict[str, Any]:
-
+@functools.lru_cache(maxsize=None)
+def _common_extension_kwargs() -> dict[str, Any]:
     args = {
-        "name": name,
-        "sources": sources,
         "include_dirs": ["src/bareduckdb/core/impl", _DUCKDB_INCLUDE],
         "extra_objects": extra_objects,
         "libraries": libraries,
@@ -323,31 +379,17 @@ def get_args(name, sources) -> dict[str, Any]:
 
     return args
 
-connection_kwargs = get_args(
-    name="bareduckdb.core.impl.connection",
-    sources=["src/bareduckdb/core/impl/connection.pyx"],
-)
 
-result_kwargs = get_args(
-    name="bareduckdb.core.impl.result",
-    sources=["src/bareduckdb/core/impl/result.pyx"],
-)
-
-python_to_value_kwargs = get_args(
-    name="bareduckdb.core.impl.python_to_value",
-    sources=["src/bareduckdb/core/impl/python_to_value.pyx"],
-)
-
-appender_kwargs = get_args(
-    name="bareduckdb.core.impl.appender",
-    sources=["src/bareduckdb/core/impl/appender.pyx"],
-)
+def get_args(name, sources) -> dict[str, Any]:
+    # Fresh lists per Extension, so a per-extension tweak can't leak into the others
+    args = {key: list(value) if isinstance(value, list) else value for key, value in _common_extension_kwargs().items()}
+    args["name"] = name
+    args["sources"] = sources
+    return args
 
 core_extensions = [
-    Extension(**connection_kwargs),
-    Extension(**result_kwargs),
-    Extension(**python_to_value_kwargs),
-    Extension(**appender_kwargs),
+    Extension(**get_args(name=f"bareduckdb.core.impl.{module}", sources=[f"src/bareduckdb/core/impl/{module}.pyx"]))
+    for module in ("connection", "result", "python_to_value", "appender")
 ]
 
 holder_scan_extensions = []
@@ -374,6 +416,41 @@ if holder_scan_pyx.exists():
 extensions = core_extensions + holder_scan_extensions
 
 
+_CYTHON_FINGERPRINT_PATH = Path(os.path.dirname(__file__)) / ".cython-fingerprint"
+
+
+def cython_fingerprint(directives):
+    """
+    Hash of everything that should force a re-cythonize: the .pyx/.pxd/.hpp files under
+    src/bareduckdb, the compiler directives, the Cython version and the contents of every
+    header under the DuckDB include directory (so a submodule bump or checkout is detected).
+    """
+    import Cython
+
+    digest = hashlib.sha256()
+    digest.update(f"{Cython.__version__}|{sorted(directives.items())}|{LATEST_DUCKDB_VERSION}|{_DUCKDB_INCLUDE}".encode())
+    for path in sorted(Path("src/bareduckdb").rglob("*")):
+        if path.suffix in (".pyx", ".pxd", ".hpp"):
+            digest.update(str(path).encode())
+            digest.update(path.read_bytes())
+    for path in sorted(_DUCKDB_INCLUDE_PATH.rglob("*")):
+        if path.suffix in (".h", ".hpp"):
+            digest.update(str(path.relative_to(_DUCKDB_INCLUDE_PATH)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+# Force regeneration only when the Cython inputs or DuckDB headers changed, not on every setup.py run
+# https://cython.readthedocs.io/en/latest/src/changes.html#alpha-11-2022-07-31
+cython_inputs_fingerprint = cython_fingerprint(cython_directives)
+try:
+    previous_fingerprint = _CYTHON_FINGERPRINT_PATH.read_text().strip()
+except OSError:
+    previous_fingerprint = None
+if previous_fingerprint != cython_inputs_fingerprint:
+    print("Cython inputs changed, forcing regeneration")
+    os.environ["CYTHON_FORCE_REGEN"] = "1"
+
 nthreads = int(os.getenv("CYTHON_NTHREADS", os.cpu_count() or 1))
 print(f"Cythonizing with {nthreads} parallel jobs")
 extensions = cythonize(
@@ -381,6 +458,7 @@ extensions = cythonize(
     compiler_directives=cython_directives,
     nthreads=nthreads,
 )
+_CYTHON_FINGERPRINT_PATH.write_text(cython_inputs_fingerprint)
 
 # Validate that the library file exists
 if LINK_MODE == "static":
@@ -486,12 +564,10 @@ class ParallelBuildExt(build_ext):
 
 # Only use py_limited_api for non-free-threaded builds
 # TODO: Update when PEP-803 lands
-bdist_wheel_options = {}
-if not hasattr(sys, '_is_gil_enabled') or sys._is_gil_enabled():  # type: ignore[attr-defined]
-    bdist_wheel_options["py_limited_api"] = STABLE_PYTHON_VERSION
+bdist_wheel_options = {"py_limited_api": STABLE_PYTHON_VERSION} if USE_LIMITED_API else {}
 
 setup(
     ext_modules=extensions,
     cmdclass={"build_ext": ParallelBuildExt},
-    options={"bdist_wheel": bdist_wheel_options} if bdist_wheel_options else {},
+    options={"bdist_wheel": bdist_wheel_options},
 )
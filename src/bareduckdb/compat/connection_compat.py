@@ -15,6 +15,16 @@ from ..core.connection_api import ConnectionAPI
 
 logger = logging.getLogger(__name__)
 
+_NO_ACTIVE_TRANSACTION = "no transaction is active"
+
+# Resolved on first use: dataset.backend imports bareduckdb, so it can't be imported at module load
+_register_table: Any = None
+_import_extension: Any = None
+
+
+def _quote_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
 
 class Connection(ConnectionAPI):
     def __init__(
@@ -28,6 +38,7 @@ class Connection(ConnectionAPI):
         udtf_functions: Optional[dict] = None,
         enable_replacement_scan: bool = False,
         _from_impl: Any = None,
+        _table_list_version: Any = None,
     ) -> None:
         """
         Create a DuckDB-compatible connection.
@@ -44,6 +55,7 @@ class Connection(ConnectionAPI):
             udtf_functions: Dict of UDTF name -> function for template expansion
             enable_replacement_scan: Enable automatic discovery from scope
             _from_impl: Internal parameter for creating cursor with shared database
+            _table_list_version: Internal parameter, shared with the parent connection by cursors
         """
         super().__init__(
             database=database,
@@ -54,6 +66,7 @@ class Connection(ConnectionAPI):
             output_type=output_type,
             enable_replacement_scan=enable_replacement_scan,
             _from_impl=_from_impl,
+            _table_list_version=_table_list_version,
         )
 
         logger.debug(
@@ -64,23 +77,23 @@ class Connection(ConnectionAPI):
 
     # DB-API 2.0 fetch methods
     def fetchall(self) -> Sequence[Sequence[Any]]:
-        return self._last_result_get().fetchall()
+        return self._last_result.fetchall()
 
     def fetchone(self) -> tuple[Any, ...] | None:
-        return self._last_result_get().fetchone()
+        return self._last_result.fetchone()
 
     def fetchmany(self, n: int = 1_000_000) -> Sequence[Any]:
-        return self._last_result_get().fetchmany(n)
+        return self._last_result.fetchmany(n)
 
     @property
     def description(self):
         """DB-API 2.0"""
-        return self._last_result_get().description
+        return self._last_result.description
 
     @property
     def rowcount(self):
         """DB-API 2.0"""
-        return self._last_result_get().rowcount
+        return self._last_result.rowcount
 
     def execute(
         self,
@@ -114,9 +127,12 @@ class Connection(ConnectionAPI):
             statistics: Statistics specification for query optimization
             replace: If True (default), replace existing registration with same name
         """
-        from bareduckdb.dataset.backend import register_table
+        global _register_table
+        if _register_table is None:
+            from bareduckdb.dataset.backend import register_table as _register_table
 
-        return register_table(self, name, data, statistics=statistics, replace=replace)
+        self._invalidate_table_cache()
+        return _register_table(self, name, data, statistics=statistics, replace=replace)
 
     def unregister(self, name: str) -> None:
         super().unregister(name)
@@ -137,6 +153,7 @@ class Connection(ConnectionAPI):
             _from_impl=cursor_impl,
             output_type=self._default_output_type,
             default_statistics=self._default_statistics,
+            _table_list_version=self._table_list_version,  # DDL through the cursor expires the parent's table list
         )
         return cursor_conn
 
@@ -148,7 +165,7 @@ class Connection(ConnectionAPI):
             self.execute("COMMIT")
         except RuntimeError as e:
             logger.debug("Error while committing: %s", e)
-            if "no transaction is active" not in str(e):
+            if _NO_ACTIVE_TRANSACTION not in str(e):
                 raise
 
     def rollback(self) -> None:
@@ -156,7 +173,7 @@ class Connection(ConnectionAPI):
             self.execute("ROLLBACK")
         except RuntimeError as e:
             logger.debug("Error while rolling back: %s", e)
-            if "no transaction is active" not in str(e):
+            if _NO_ACTIVE_TRANSACTION not in str(e):
                 raise
 
     def close(self) -> None:
@@ -191,24 +208,20 @@ class Connection(ConnectionAPI):
             raise ValueError("The provided 'version' can not be empty!")
 
         # Build the INSTALL statement
-        sql_parts = ["INSTALL", extension]
+        sql_parts = ["FORCE INSTALL" if force_install else "INSTALL", extension]
 
         # Add FROM clause if repository or repository_url is specified
         if repository is not None:
             sql_parts.extend(["FROM", repository])
         elif repository_url is not None:
-            sql_parts.extend(["FROM", f"'{repository_url}'"])
+            sql_parts.extend(["FROM", _quote_literal(repository_url)])
 
         # Add VERSION clause if specified
         if version is not None:
-            sql_parts.extend(["VERSION", f"'{version}'"])
+            sql_parts.extend(["VERSION", _quote_literal(version)])
 
         sql = " ".join(sql_parts)
 
-        # Execute with FORCE INSTALL if requested
-        if force_install:
-            sql = sql.replace("INSTALL", "FORCE INSTALL", 1)
-
         logger.debug("Installing extension: %s", sql)
         self.execute(sql)
 
@@ -223,13 +236,15 @@ class Connection(ConnectionAPI):
         Raises:
             ImportError: If duckdb-extensions or specific extension package not found
         """
-        try:
-            from duckdb_extensions import import_extension  # type: ignore[import-not-found]
-        except ImportError as e:
-            raise ImportError(f"duckdb-extensions package not installed. Install with: pip install duckdb-extensions duckdb-extension-{name}") from e
+        global _import_extension
+        if _import_extension is None:
+            try:
+                from duckdb_extensions import import_extension as _import_extension  # type: ignore[import-not-found]
+            except ImportError as e:
+                raise ImportError(f"duckdb-extensions package not installed. Install with: pip install duckdb-extensions duckdb-extension-{name}") from e
 
         # import_extension needs access to the raw DuckDB connection
-        import_extension(name, force_install=force_install, con=self)  # pyright: ignore[reportPrivateUsage]
+        _import_extension(name, force_install=force_install, con=self)  # pyright: ignore[reportPrivateUsage]
 
     def load_extension(self, extension: str) -> None:
         """
@@ -251,29 +266,15 @@ class Connection(ConnectionAPI):
         return False
 
     # DuckDB-python API aliases (for compatibility with duckdb-python's bloated API)
-    def sql(self, *args, **kwargs):
-        return self.execute(*args, **kwargs)
-
-    def arrow(self):
-        return self.arrow_reader()
-
-    def fetch_arrow_table(self):
-        return self.arrow_table()
-
-    def to_arrow(self):
-        return self.arrow_table()
-
-    def to_arrow_table(self):
-        return self.arrow_table()
-
-    def fetch_record_batch(self):
-        return self.arrow_reader()
+    sql = execute
 
-    def to_pandas(self):
-        return self.df()
+    arrow = ConnectionAPI.arrow_reader
+    fetch_record_batch = ConnectionAPI.arrow_reader
 
-    def to_polars(self, **kwargs):
-        return self.pl(**kwargs)
+    fetch_arrow_table = ConnectionAPI.arrow_table
+    to_arrow = ConnectionAPI.arrow_table
+    to_arrow_table = ConnectionAPI.arrow_table
 
-    def fetch_df(self):
-        return self.df()
+    to_pandas = ConnectionAPI.df
+    fetch_df = ConnectionAPI.df
+    to_polars = ConnectionAPI.pl
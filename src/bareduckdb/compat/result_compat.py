@@ -36,6 +36,7 @@ class Result:
     # Instance attributes
     _table: pa.Table | None  # cached materialized table: None until needed
     _reader: PyArrowCapsule | pa.RecordBatchReader | None
+    _pl_frame: pl.DataFrame | None  # cached polars conversion: the reader can only be consumed once
     _offset: int  # fetch offset
     _read: bool
     _result_lock: threading.Lock
@@ -61,6 +62,7 @@ class Result:
             self._table = None
             self._reader = result_obj
 
+        self._pl_frame = None
         self._read = False
         self._offset = 0  # Current row offset for fetchone/fetchmany
         self._result_lock = threading.Lock()
@@ -130,10 +132,14 @@ class Result:
         if lazy:  # pl_lazy makes more sense from a typing perspective
             return self.pl_lazy()  # type: ignore
 
-        import polars as pl
+        if self._pl_frame is None:
+            import polars as pl
+
+            # Pass self to use __arrow_c_stream__() protocol, avoiding PyArrow import checks
+            self._pl_frame = pl.from_arrow(self, rechunk=False)  # pyright: ignore[reportAttributeAccessIssue]
 
-        # Pass self to use __arrow_c_stream__() protocol, avoiding PyArrow import checks
-        return pl.from_arrow(self, rechunk=rechunk)  # pyright: ignore[reportReturnType]
+        # Polars frames can be mutated in place: hand out a clone, which shares the cached buffers
+        return self._pl_frame.rechunk() if rechunk else self._pl_frame.clone()  # type: ignore[union-attr]
 
     def pl_lazy(self, batch_size: int | None = None) -> pl.LazyFrame:
         """
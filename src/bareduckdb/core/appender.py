@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 from typing import TYPE_CHECKING, Any, Sequence
 
 if TYPE_CHECKING:
@@ -7,6 +8,12 @@ if TYPE_CHECKING:
 
 from .impl.appender import AppenderImpl  # type: ignore[import-untyped]
 
+_ARROW_SOURCE_IDS = itertools.count()
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
 
 class Appender:
     """
@@ -34,7 +41,7 @@ class Appender:
         - uuid.UUID -> VARCHAR: DuckDB parses to UUID
     """
 
-    __slots__ = ("_impl",)
+    __slots__ = ("_impl", "_connection", "_target")
 
     def __init__(
         self,
@@ -53,6 +60,10 @@ class Appender:
             catalog: Catalog name (optional, for multi-catalog databases)
         """
         self._impl = AppenderImpl(connection._impl, table, schema, catalog)
+        self._connection = connection
+        # "catalog"."table" would resolve as schema.table first: spell out the C appender's default schema
+        target_schema = schema if schema or not catalog else "main"
+        self._target = ".".join(_quote_identifier(part) for part in (catalog, target_schema, table) if part)
 
     def append_row(self, *values: Any) -> Appender:
         """
@@ -67,6 +78,17 @@ class Appender:
         self._impl.append_row(*values)
         return self
 
+    def append_row_tuple(self, row: tuple) -> None:
+        """
+        Append a single row from an already-built tuple.
+
+        Faster than append_row() in tight loops: no varargs re-boxing and no chaining.
+
+        Args:
+            row: Values for each column in the row
+        """
+        self._impl.append_row_tuple(row)
+
     def append_rows(self, rows: Sequence[Sequence[Any]]) -> Appender:
         """
         Append multiple rows.
@@ -81,6 +103,30 @@ class Appender:
         self._impl.append_rows(rows)
         return self
 
+    def append_arrow(self, data: Any) -> Appender:
+        """
+        Append Arrow data in one columnar INSERT instead of row by row.
+
+        Pending rows are flushed first, so ordering relative to append_row() is preserved.
+        Columns are matched by position.
+
+        Args:
+            data: pyarrow Table/RecordBatch/RecordBatchReader, or any object registrable with the connection
+
+        Returns:
+            self for chaining
+        """
+        self._impl.flush()
+
+        source = f"_appender_arrow_{next(_ARROW_SOURCE_IDS):x}"
+        self._connection._call(
+            f"INSERT INTO {self._target} SELECT * FROM {source}",
+            output_type="arrow_capsule",
+            data={source: data},
+            data_statistics=False,  # the source is scanned once in full: min/max wouldn't prune anything
+        )
+        return self
+
     def append_default(self) -> Appender:
         """
         Append the DEFAULT value for the current column.
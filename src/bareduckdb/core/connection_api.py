@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import ast
-import inspect
+import itertools
 import logging
-import uuid
+import re
+import sys
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -17,9 +19,95 @@ from .connection_base import ConnectionBase
 logger = logging.getLogger(__name__)
 
 
+class _NoResult:
+    """Stands in for _last_result before the first execute(): falsy, and any attribute access raises."""
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __getattr__(self, name: str) -> Any:
+        raise RuntimeError("No last result")
+
+
+_NO_RESULT = _NoResult()
+
+# Process-wide counter for UDTF table names: unique without touching the OS RNG
+_UDTF_TABLE_IDS = itertools.count()
+
+_QUOTES = frozenset(b"'\"")
+_OPEN_PAREN = ord("(")
+_CLOSE_PAREN = ord(")")
+
+
+def _call_span(query_bytes: bytes, location: int | None, func_name: str) -> tuple[int, int] | None:
+    """
+    Byte span of a table function call, from the parser's query_location to its closing parenthesis.
+
+    Returns None when the call can't be located unambiguously (no location, or schema-qualified names).
+    """
+    if location is None:
+        return None
+
+    name_bytes = func_name.encode("utf-8")
+    if query_bytes[location : location + len(name_bytes)].lower() != name_bytes.lower():
+        return None
+
+    pos = location + len(name_bytes)
+    while pos < len(query_bytes) and query_bytes[pos] in b" \t\r\n":
+        pos += 1
+    if pos >= len(query_bytes) or query_bytes[pos] != _OPEN_PAREN:
+        return None
+
+    depth = 0
+    quote = None
+    for end in range(pos, len(query_bytes)):
+        char = query_bytes[end]
+        if quote is not None:
+            if char == quote:  # doubled quotes ('') simply close and reopen
+                quote = None
+        elif char in _QUOTES:
+            quote = char
+        elif char == _OPEN_PAREN:
+            depth += 1
+        elif char == _CLOSE_PAREN:
+            depth -= 1
+            if depth == 0:
+                return location, end + 1
+    return None
+
+
+class _TableListVersion:
+    """
+    Version token shared by a connection and the cursors created from it.
+
+    They all see one database, so a statement on any of them that may change the table list
+    replaces the token, expiring every cached list at once.
+    """
+
+    __slots__ = ("token",)
+
+    def __init__(self) -> None:
+        self.token = object()
+
+    def bump(self) -> None:
+        self.token = object()  # a single assignment: concurrent bumps can't be lost
+
+
 class ConnectionAPI(ConnectionBase):
-    _udtf_registry: dict[str, Callable]
-    _last_result: Result  # Result or None
+    _PARSE_CACHE_SIZE = 512
+    # Statement types that can't create, drop or rename a table, so the cached table list stays valid
+    _TABLE_PRESERVING_STATEMENTS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE"})
+
+    _udtf_registry: dict[str, tuple[Callable, bool]]
+    _udtf_names: frozenset[str]
+    _udtf_names_lower: frozenset[str]
+    _parse_cache: OrderedDict[str, dict]
+    _existing_tables: set[str] | None
+    _existing_tables_token: object  # _table_list_version.token when _existing_tables was listed
+    _table_list_version: _TableListVersion
+    _last_result: Result | _NoResult
     _default_output_type: Literal["arrow_table", "arrow_reader", "arrow_capsule"]
 
     def __init__(
@@ -34,6 +122,7 @@ class ConnectionAPI(ConnectionBase):
         output_type: Literal["arrow_table", "arrow_reader", "arrow_capsule"] = "arrow_table",
         enable_replacement_scan: bool = False,
         _from_impl: Any = None,
+        _table_list_version: _TableListVersion | None = None,
     ) -> None:
         """
         Args:
@@ -45,6 +134,7 @@ class ConnectionAPI(ConnectionBase):
             udtf_functions: Dict of UDTF name -> function
             output_type: Default output format for queries
             _from_impl: Internal parameter for creating cursor with shared database
+            _table_list_version: Internal parameter, shared with the parent connection by cursors
         """
         super().__init__(
             database=database,
@@ -55,9 +145,15 @@ class ConnectionAPI(ConnectionBase):
             _from_impl=_from_impl,
         )
 
-        self._udtf_registry: dict[str, Callable] = {}
+        self._udtf_registry: dict[str, tuple[Callable, bool]] = {}
+        self._udtf_names = frozenset()
+        self._udtf_names_lower = frozenset()
         self._default_output_type = output_type
-        self._last_result = None
+        self._last_result = _NO_RESULT
+        self._parse_cache = OrderedDict()
+        self._existing_tables = None
+        self._existing_tables_token = None
+        self._table_list_version = _table_list_version if _table_list_version is not None else _TableListVersion()
         self.enable_replacement_scan = enable_replacement_scan
 
         if udtf_functions:
@@ -87,12 +183,11 @@ class ConnectionAPI(ConnectionBase):
             kwargs: Function arguments (for logging only)
 
         Returns:
-            Table name like "_udtf_faker_abc12345"
+            Table name like "_udtf_faker_1a"
         """
-        unique_id = uuid.uuid4().hex[:8]
-
-        table_name = f"_udtf_{func_name}_{unique_id}"
-        logger.debug("Generated table name: %s for %s(%s)", table_name, func_name, kwargs)
+        table_name = f"_udtf_{func_name}_{next(_UDTF_TABLE_IDS):x}"
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Generated table name: %s for %s(%s)", table_name, func_name, kwargs)
 
         return table_name
 
@@ -100,14 +195,12 @@ class ConnectionAPI(ConnectionBase):
         if func_name not in self._udtf_registry:
             raise ValueError(f"UDTF '{func_name}' not registered")
 
-        func = self._udtf_registry[func_name]
+        func, wants_conn = self._udtf_registry[func_name]
         kwargs = kwargs or {}
 
-        sig = inspect.signature(func)
-        params = list(sig.parameters.keys())
-
-        if params and params[-1] == "conn":
-            logger.debug("UDTF '%s' requests conn injection", func_name)
+        if wants_conn:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("UDTF '%s' requests conn injection", func_name)
             result = func(*args, **kwargs, conn=self)
         else:
             result = func(*args, **kwargs)
@@ -117,19 +210,33 @@ class ConnectionAPI(ConnectionBase):
 
         return result
 
-    def register_udtf(self, name: str, func: Callable) -> None:
+    def register_udtf(self, name: str, func: Callable, *, wants_conn: bool | None = None) -> None:
         """
         Register a UDTF by name.
 
         Args:
             name: UDTF name to use in SQL
             func: Python function that returns Arrow-compatible data
+            wants_conn: Whether to pass the connection as ``conn=``. By default, detected
+                from the signature (last parameter named ``conn``)
         """
         if not callable(func):
             raise TypeError(f"UDTF must be callable, got {type(func)}")
 
-        self._udtf_registry[name] = func
-        logger.debug("Registered UDTF: %s", name)
+        if wants_conn is None:
+            import inspect
+
+            try:
+                params = inspect.signature(func).parameters
+            except (TypeError, ValueError):  # no introspectable signature, e.g. some builtins
+                params = {}
+            wants_conn = bool(params) and next(reversed(params)) == "conn"
+
+        self._udtf_registry[name] = (func, wants_conn)
+        self._udtf_names = frozenset(self._udtf_registry)
+        self._udtf_names_lower = frozenset(n.lower() for n in self._udtf_names)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Registered UDTF: %s", name)
 
     def execute(
         self,
@@ -139,119 +246,207 @@ class ConnectionAPI(ConnectionBase):
         output_type: Literal["arrow_table", "arrow_reader", "arrow_capsule"] | None = None,
         data: Mapping[str, Any] | None = None,
     ):
-        self._last_result = None
+        self._last_result = _NO_RESULT
         if output_type is None:
             output_type = self._default_output_type
 
-        query, data = self._preprocess(query, data)
+        if self.enable_replacement_scan or self._udtf_names:
+            # The parse stays local: another thread's execute() can't swap it before the cache update
+            query, data, parse_result = self._preprocess_with_parse(query, data)
 
-        result = self._call(query=query, output_type=output_type, parameters=parameters, data=data)
+            try:
+                result = self._call(query=query, output_type=output_type, parameters=parameters, data=data)
+            finally:
+                self._update_table_cache(query, parse_result)
+        else:
+            # Fast path: nothing to preprocess. Unparsed queries may be DDL, so the table cache is dropped
+            self._invalidate_table_cache()
+            result = self._call(query=query, output_type=output_type, parameters=parameters, data=data)
         result = Result(result)
         self._last_result = result
 
         return self
 
-    def _get_replacement(self, name: str) -> PyArrowCapsule | None:
-        import inspect
-
-        for frame_info in inspect.stack()[1:]:  # Skip current frame
-            frame = frame_info.frame
+    def _get_replacements(self, names: set[str]) -> dict[str, PyArrowCapsule]:
+        """
+        Look up names in the callers' frames, innermost first, in a single stack walk.
 
-            if name in frame.f_locals:
-                obj = frame.f_locals[name]
-                if hasattr(obj, "__arrow_c_stream__"):
-                    logger.debug("Replacement scan: found %s in frame locals", name)
-                    return obj
+        The first frame defining a name decides: it is returned if it implements __arrow_c_stream__, otherwise skipped.
+        bareduckdb's own frames are passed over, so their locals and module globals never shadow the caller's names.
+        """
+        replacements: dict[str, PyArrowCapsule] = {}
+        pending = set(names)
+
+        frame = sys._getframe(2)  # Skip _get_replacements and its preprocessing caller
+        while frame is not None and pending:
+            f_globals = frame.f_globals
+            module = f_globals.get("__name__", "")
+            if module == "bareduckdb" or module.startswith("bareduckdb."):
+                frame = frame.f_back
+                continue
+
+            f_locals = frame.f_locals
+
+            for name in tuple(pending):
+                if name in f_locals:
+                    obj, scope = f_locals[name], "locals"
+                elif name in f_globals:
+                    obj, scope = f_globals[name], "globals"
                 else:
-                    logger.warning("Replacement scan: %s found but doesn't implement __arrow_c_stream__", name)
-                    return None
+                    continue
 
-            if name in frame.f_globals:
-                obj = frame.f_globals[name]
+                pending.discard(name)
                 if hasattr(obj, "__arrow_c_stream__"):
-                    logger.debug("Replacement scan: found %s in frame globals", name)
-                    return obj
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Replacement scan: found %s in frame %s", name, scope)
+                    replacements[name] = obj
                 else:
                     logger.warning("Replacement scan: %s found but doesn't implement __arrow_c_stream__", name)
-                    return None
 
-        return None
+            frame = frame.f_back
+
+        return replacements
+
+    def _parse_sql_cached(self, query: str) -> dict:
+        """Parse with DuckDB's parser, memoized by query text (FIFO eviction) so re-executed queries skip the parse."""
+        parse_result = self._parse_cache.get(query)
+        if parse_result is None:
+            parse_result = self._impl.parse_sql(query)
+            if len(self._parse_cache) >= self._PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+            self._parse_cache[query] = parse_result
+        return parse_result
 
     def _preprocess(self, query, data):
+        """Handle UDTFs and Replacement Scans, returning the rewritten (query, data)."""
+        query, data, _ = self._preprocess_with_parse(query, data)
+        return query, data
+
+    def _preprocess_with_parse(self, query, data) -> tuple[str, Any, dict | None]:
         """Handle UDTFs and Replacement Scans
 
         The goals here are:
         - Bindings don't need to call back into Python, allowing threading
         - Easier extension/customization of inspection & UDTF logic - all in Python
         - Faster execution - no Python callbacks (which has threading implications), and arrow statistics
+
+        Also returns the parse result (None when the query wasn't parsed), so execute() can reuse it after the query runs.
         """
-        if not self.enable_replacement_scan and len(self._udtf_registry) == 0:
-            return query, data
+        if not self.enable_replacement_scan:
+            if len(self._udtf_registry) == 0:
+                return query, data, None
+
+            # Cheap prefilter: a query that doesn't mention any UDTF name can't call one
+            lowered = query.lower()
+            if not any(name in lowered for name in self._udtf_names_lower):
+                return query, data, None
 
         # using DuckDB Parser
         try:
-            parse_result = self._impl.parse_sql(query)
+            parse_result = self._parse_sql_cached(query)
         except Exception as e:
             logger.warning("Failed to parse SQL for preprocessing: %s", e)
-            return query, data or {}
+            return query, data or {}, None
 
         if parse_result.get("error"):
             logger.warning("SQL parsing error: %s", parse_result.get("error_message"))
-            return query, data or {}
+            return query, data or {}, None
 
         data = data or {}
 
         if self.enable_replacement_scan:
-            try:
-                tables_result = self._call("SHOW TABLES", output_type="arrow_table")
-                existing_tables = {row["name"] for row in tables_result.to_pylist()}
-            except Exception as e:
-                logger.warning("Failed to get table list: %s", e)
-                existing_tables = set()
+            existing_tables = self._existing_tables
+            version_token = self._table_list_version.token
+            if existing_tables is None or self._existing_tables_token is not version_token:
+                try:
+                    # The token is read before listing, so DDL racing SHOW TABLES expires this list
+                    tables_result = self._call("SHOW TABLES", output_type="arrow_table")
+                    existing_tables = set(tables_result.column("name").to_pylist())
+                    self._existing_tables = existing_tables
+                    self._existing_tables_token = version_token
+                except Exception as e:
+                    logger.warning("Failed to get table list: %s", e)
+                    existing_tables = set()
 
             table_refs = set(parse_result.get("table_refs", []))
             unknown_tables = table_refs - existing_tables
 
-            for table_name in unknown_tables:
-                replacement = self._get_replacement(table_name)
-                if replacement is not None:
-                    data[table_name] = replacement
-                    logger.debug("Replacement scan found: %s", table_name)
+            if unknown_tables:
+                data.update(self._get_replacements(unknown_tables))
 
-        # UDTF processing
-        if len(self._udtf_registry) > 0:
-            function_calls = parse_result.get("function_calls", [])
-            replacements = []
+        # UDTF processing: most table functions are built-ins (range, read_csv, ...), so filter to registered UDTFs first
+        udtf_names = self._udtf_names
+        udtf_calls = []
+        if udtf_names:
+            udtf_calls = [func_info for func_info in parse_result.get("function_calls", ()) if func_info["name"] in udtf_names]
+        if udtf_calls:
+            query_bytes = query.encode("utf-8")  # parser locations are byte offsets
+            spans: list[tuple[int, int, str]] = []
+            replacements: dict[str, str] = {}
 
-            for func_info in function_calls:
+            for func_info in udtf_calls:
                 func_name = func_info["name"]
-                if func_name in self._udtf_registry:
-                    raw_args = func_info.get("args", [])
-                    raw_kwargs = func_info.get("kwargs", {})
-                    args = [self._parse_sql_value(arg) for arg in raw_args]
-                    kwargs = {k: self._parse_sql_value(v) for k, v in raw_kwargs.items()}
+                raw_args = func_info.get("args", [])
+                raw_kwargs = func_info.get("kwargs", {})
+                args = [self._parse_sql_value(arg) for arg in raw_args]
+                kwargs = {k: self._parse_sql_value(v) for k, v in raw_kwargs.items()}
 
-                    table_name = self._generate_table_name(func_name, args)  # type: ignore
+                table_name = self._generate_table_name(func_name, args)  # type: ignore
 
-                    try:
-                        result = self._call_udtf(func_name, args, kwargs)
-                        data[table_name] = result
+                try:
+                    result = self._call_udtf(func_name, args, kwargs)
+                    data[table_name] = result
+                    if logger.isEnabledFor(logging.DEBUG):
                         logger.debug("Executed UDTF %s -> %s", func_name, table_name)
 
-                        # Reconstruct original text
+                    span = _call_span(query_bytes, func_info.get("query_location"), func_name)
+                    if span is not None:
+                        spans.append((*span, table_name))
+                    else:
+                        # Fall back to matching reconstructed text
                         arg_parts = list(raw_args)
                         kwarg_parts = [f"{k} := {v}" for k, v in raw_kwargs.items()]
                         original_text = f"{func_name}({', '.join(arg_parts + kwarg_parts)})"
 
-                        replacements.append({"original": original_text, "replacement": table_name})
-                    except Exception as e:
-                        logger.error("Failed to execute UDTF %s: %s", func_name, e)
-                        raise RuntimeError(f"UDTF execution failed for {func_name}: {e}") from e
-
-            for repl in replacements:
-                query = query.replace(repl["original"], repl["replacement"])
-
-        return query, data
+                        # Repeated identical calls all map to the first table, as the old sequential replace did
+                        replacements.setdefault(original_text, table_name)
+                except Exception as e:
+                    logger.error("Failed to execute UDTF %s: %s", func_name, e)
+                    raise RuntimeError(f"UDTF execution failed for {func_name}: {e}") from e
+
+            if spans:
+                # Splice by offset: robust to whitespace/quoting, and never touches string literals
+                parts = []
+                last_end = 0
+                for start, end, table_name in sorted(spans):
+                    if start < last_end:  # overlapping span, leave as is
+                        continue
+                    parts.append(query_bytes[last_end:start])
+                    parts.append(table_name.encode("utf-8"))
+                    last_end = end
+                parts.append(query_bytes[last_end:])
+                query = b"".join(parts).decode("utf-8")
+
+            if len(replacements) == 1:
+                ((original, table_name),) = replacements.items()
+                query = query.replace(original, table_name)
+            elif replacements:
+                # Single pass, longest first, so inserted table names are never rewritten again
+                pattern = re.compile("|".join(re.escape(original) for original in sorted(replacements, key=len, reverse=True)))
+                query = pattern.sub(lambda m: replacements[m.group(0)], query)
+
+        return query, data, parse_result
+
+    def _update_table_cache(self, query: str, parse_result: dict | None) -> None:
+        """Drop the cached table list unless the statement just executed can't have changed it."""
+        # Only the first statement is parsed, so multi-statement queries also refresh the table list
+        if parse_result is None or parse_result.get("statement_type") not in self._TABLE_PRESERVING_STATEMENTS or ";" in query.rstrip().rstrip(";"):
+            self._invalidate_table_cache()
+
+    def _invalidate_table_cache(self) -> None:
+        """Drop the cached table list, here and on every connection sharing this database handle."""
+        self._existing_tables = None
+        self._table_list_version.bump()
 
     def _last_result_get(self):
         """Get last result or raise if none available."""
@@ -259,17 +454,28 @@ class ConnectionAPI(ConnectionBase):
             raise RuntimeError("No last result")
         return self._last_result
 
+    # _last_result raises "No last result" on access until execute() succeeds, so no explicit check is needed
     def arrow_table(self):
-        return self._last_result_get().arrow_table()
+        return self._last_result.arrow_table()
 
     def arrow_reader(self):
-        return self._last_result_get().arrow_reader()
+        return self._last_result.arrow_reader()
 
     def df(self):
-        return self._last_result_get().df()
+        return self._last_result.df()
 
     def pl(self, lazy: bool = False):
-        return self._last_result_get().pl(lazy=lazy)
+        return self._last_result.pl(lazy=lazy)
 
     def pl_lazy(self, batch_size: int | None = None):
-        return self._last_result_get().pl_lazy(batch_size=batch_size)
+        return self._last_result.pl_lazy(batch_size=batch_size)
+
+    def _drop_registration(self, name: str) -> None:
+        super()._drop_registration(name)
+        if self._existing_tables is not None:
+            self._existing_tables.discard(name)
+
+    def close(self) -> None:
+        self._last_result = _NO_RESULT
+        self._existing_tables = None
+        super().close()
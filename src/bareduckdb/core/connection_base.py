@@ -4,15 +4,16 @@ Core bindings to DuckDB Connections, Registration and Executions
 
 from __future__ import annotations
 
+import importlib.util
 import logging
 import threading
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .impl.connection import ConnectionImpl  # type: ignore[import-untyped]
 
 if TYPE_CHECKING:
-    from typing import Any, Literal, Mapping, Optional, Sequence  # type: ignore[attr-defined]
+    from typing import Literal, Mapping, Optional, Sequence  # type: ignore[attr-defined]
 
     import pandas as pd
     import polars as pl
@@ -24,6 +25,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Probed once without importing pyarrow, which stays optional and is imported lazily
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Bound on first registration: bareduckdb.dataset imports this module
+_register_table: Any = None
+
 
 class ConnectionBase:
     """
@@ -40,6 +47,14 @@ class ConnectionBase:
     _MODE_ARROW_CAPSULE = "arrow_capsule"
     _MODE_STREAM = "stream"
 
+    # output_type -> execution mode; arrow_table's mode follows arrow_table_collector
+    _OUTPUT_MODES: dict[str, str | None] = {
+        "arrow_table": None,
+        "arrow_reader": _MODE_STREAM,
+        "arrow_capsule": _MODE_ARROW_CAPSULE,
+        "pl": _MODE_ARROW_CAPSULE,
+    }
+
     # Instance attributes
     _impl: Any
     _lock: threading.Lock
@@ -47,6 +62,8 @@ class ConnectionBase:
     _database_path: str | None
     _arrow_table_collector: Literal["arrow", "stream"]
     _default_statistics: "Literal['numeric'] | bool | None"
+    _python_data_functions_registered: bool  # python_data_scan registered on this connection
+    _holder_factories: dict[str, tuple[Any, Any]]  # name -> (factory_ptr, holder), kept alive while registered
 
     def __init__(
         self,
@@ -79,6 +96,8 @@ class ConnectionBase:
             self._impl = _from_impl
             self._lock = threading.Lock()
             self._registered_objects: dict[str, Any] = {}
+            self._python_data_functions_registered = False
+            self._holder_factories = {}
             self._database_path: str | None = _from_impl.database_path
             self.arrow_table_collector = arrow_table_collector
             self._default_statistics = default_statistics
@@ -97,6 +116,8 @@ class ConnectionBase:
 
             self._lock = threading.Lock()
             self._registered_objects: dict[str, Any] = {}
+            self._python_data_functions_registered = False
+            self._holder_factories = {}
             self._database_path: str | None = database
             self.arrow_table_collector = arrow_table_collector
             self._default_statistics = default_statistics
@@ -119,9 +140,11 @@ class ConnectionBase:
         """Register data using DataHolder"""
         effective_statistics = statistics if statistics is not None else self._default_statistics
 
-        from ..dataset import register_table
+        global _register_table
+        if _register_table is None:
+            from ..dataset import register_table as _register_table
 
-        is_registered = register_table(self, name, data, statistics=effective_statistics)
+        is_registered = _register_table(self, name, data, statistics=effective_statistics)
         if is_registered:
             logger.debug("Registered table '%s' via DataHolder", name)
             return
@@ -156,7 +179,7 @@ class ConnectionBase:
 
         if hasattr(capsule, "scanner"):
             capsule = capsule.scanner().to_reader()  # type: ignore
-        if hasattr(capsule, "to_reader"):
+        elif hasattr(capsule, "to_reader"):
             capsule = capsule.to_reader()  # type: ignore
 
         if hasattr(capsule, "__arrow_c_stream__"):
@@ -179,6 +202,7 @@ class ConnectionBase:
         parameters: Sequence[Any] | Mapping[str, Any] | None = None,
         data: Mapping[str, Any] | None = None,
         batch_size: int = 1_000_000,
+        data_statistics: "list[str] | Literal['numeric'] | str | bool | None" = None,
     ) -> pa.Table | pa.RecordBatchReader | PyArrowCapsule:
         """
         Core execution method - executes query and returns result in requested format.
@@ -189,64 +213,75 @@ class ConnectionBase:
             parameters: Query parameters (positional list or named dict, keyword-only)
             data: dict of objects for replacement scanning
             batch_size [1_000_000]: Arrow batch size
+            data_statistics: Statistics for the data registrations; None uses the connection's default_statistics
 
         Returns:
             Result in requested format (pa.Table, pa.RecordBatchReader, or capsule)
         """
+        try:
+            mode = ConnectionBase._OUTPUT_MODES[output_type]
+        except KeyError:
+            raise ValueError(f"Invalid output_type: {output_type}") from None
+        if mode is None:
+            mode = ConnectionBase._MODE_ARROW if self.arrow_table_collector == "arrow" else ConnectionBase._MODE_STREAM
+
+        debug = logger.isEnabledFor(logging.DEBUG)  # timing is only worth measuring when it's logged
+        materialized = None
         with self._lock:
-            if output_type == "arrow_table":
-                mode = ConnectionBase._MODE_ARROW if self.arrow_table_collector == "arrow" else ConnectionBase._MODE_STREAM
-            elif output_type == "arrow_reader":
-                mode = ConnectionBase._MODE_STREAM
-            elif output_type in ("arrow_capsule", "pl"):
-                mode = ConnectionBase._MODE_ARROW_CAPSULE
-            else:
-                raise ValueError(f"Invalid output_type: {output_type}")
-
-            logger.debug(
-                "Executing query with output_type=%s, mode=%s",
-                output_type,
-                mode,
-            )
+            if debug:
+                logger.debug(
+                    "Executing query with output_type=%s, mode=%s",
+                    output_type,
+                    mode,
+                )
 
             _data_to_unregister: list[str] = []
 
             try:
                 if data:
                     for name, data_obj in data.items():
-                        self._register_arrow(name, data_obj)
+                        self._register_arrow(name, data_obj, statistics=data_statistics)
                         _data_to_unregister.append(name)
 
-                t_exec_start = time.perf_counter()
-                base_result = self._impl.call_impl(query=query, mode=mode, batch_size=batch_size, parameters=parameters)
-                t_exec_end = time.perf_counter()
-                logger.debug("Query execution: %.4fs", (t_exec_end - t_exec_start))
+                if debug:
+                    t_exec_start = time.perf_counter()
+                # Statements binding per-call registered data aren't worth keeping in the statement cache
+                base_result = self._impl.call_impl(query=query, mode=mode, batch_size=batch_size, parameters=parameters, cache_statement=not data)
+                if debug:
+                    logger.debug("Query execution: %.4fs", (time.perf_counter() - t_exec_start))
 
                 # Convert
-                t_convert_start = time.perf_counter()
                 if output_type == "arrow_table":
-                    try:
-                        import pyarrow  # noqa: F401
-                    except ImportError:
+                    if not _HAS_PYARROW:
                         logger.debug("pyarrow not available, returning capsule")
                         return base_result.__arrow_c_stream__(None)
 
-                    result = base_result.to_arrow()
-                    t_convert_end = time.perf_counter()
-                    logger.debug("Arrow conversion: %.4fs", (t_convert_end - t_convert_start))
-                    return result
+                    if mode == ConnectionBase._MODE_ARROW:
+                        # Fully collected by the PhysicalArrowCollector: convert after releasing the lock
+                        materialized = base_result
+                    else:
+                        # Streaming conversion still pulls chunks from the connection
+                        return base_result.to_arrow()
                 elif output_type == "arrow_reader":  # return capsule as a RecordBatchReader
                     import pyarrow as pa  # type: ignore[import]
 
-                    capsule = base_result.__arrow_c_stream__(None)
-                    return pa.RecordBatchReader._import_from_c_capsule(capsule)  # type: ignore
+                    return pa.RecordBatchReader.from_stream(base_result)
                 elif output_type == "arrow_capsule":
                     return base_result.__arrow_c_stream__(None)
                 else:
                     raise ValueError(f"Invalid output_type: {output_type}")
             finally:
+                # Already holding _lock: drop the per-call registrations in one pass
                 for name in _data_to_unregister:
-                    self.unregister(name)
+                    self._drop_registration(name)
+
+        if not debug:
+            return materialized.to_arrow()
+
+        t_convert_start = time.perf_counter()
+        result = materialized.to_arrow()
+        logger.debug("Arrow conversion: %.4fs", (time.perf_counter() - t_convert_start))
+        return result
 
     def unregister(self, name: str) -> None:
         """
@@ -256,12 +291,16 @@ class ConnectionBase:
             name: Table name to unregister
         """
         logger.debug("Unregistering table: %s", name)
-        with self._DUCKDB_INIT_LOCK:
-            self._impl.unregister(name)
+        # Dropping the view is a per-connection operation, so the global init lock isn't needed
+        with self._lock:
+            self._drop_registration(name)
+
+    def _drop_registration(self, name: str) -> None:
+        """Drop a registered table. Caller must hold self._lock."""
+        self._impl.unregister(name)
 
-            # Clean up capsule registrations
-            if name in self._registered_objects:
-                del self._registered_objects[name]
+        # Clean up capsule registrations
+        self._registered_objects.pop(name, None)
 
     def close(self) -> None:
         logger.debug("Closing connection")
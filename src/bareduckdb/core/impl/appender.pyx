@@ -255,7 +255,7 @@ cdef class AppenderImpl:
 
         raise TypeError(f"Unsupported type for appender: {type(value).__name__}")
 
-    def append_row(self, *args):
+    cdef void _append_row(self, object row) except *:
 
         if self._closed:
             raise RuntimeError("Appender is closed")
@@ -267,17 +267,24 @@ cdef class AppenderImpl:
             state = duckdb_appender_begin_row(appender)
         self._check_state(state)
 
-        for value in args:
+        for value in row:
             self._append_value(value)
 
         with nogil:
             state = duckdb_appender_end_row(appender)
         self._check_state(state)
 
+    def append_row(self, *args):
+        self._append_row(args)
+
+    def append_row_tuple(self, tuple row):
+        # No *args re-boxing: the caller's tuple is iterated directly
+        self._append_row(row)
+
     def append_rows(self, rows):
 
         for row in rows:
-            self.append_row(*row)
+            self._append_row(row)
 
     def append_default(self):
 
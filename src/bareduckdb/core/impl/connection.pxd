@@ -124,9 +124,14 @@ cdef extern from "cpp_helpers.hpp" namespace "bareduckdb":
     # Prepared / Parameters
     QueryResult* execute_prepared_statement(
         duckdb_connection c_conn, const char *query, void* params_map_ptr,
-        bool allow_stream_result, bool use_arrow_collector, uint64_t batch_size
+        bool allow_stream_result, bool use_arrow_collector, uint64_t batch_size,
+        void* stmt_cache_ptr
     ) nogil
 
+    # Prepared statement cache (one per connection)
+    void* create_prepared_statement_cache(size_t capacity) except +
+    void destroy_prepared_statement_cache(void* cache_ptr) nogil
+
     # Capsule
     void register_capsule_stream(
         duckdb_connection c_conn, void* stream_capsule,
@@ -180,6 +185,7 @@ cdef extern from "cpp_helpers.hpp" namespace "bareduckdb":
         vector[string] args
         vector[pair[string, string]] kwargs
         string original_text
+        int64_t query_location
 
     cdef cppclass ParseResultInfo:
         string statement_type
@@ -201,5 +207,6 @@ cdef class ConnectionImpl:
     cdef DuckDBConnection* _cpp_conn
     cdef str _database_path
     cdef bool _closed
+    cdef void* _stmt_cache
 
     cdef DuckDBConnection* _get_cpp_connection(self) except +
@@ -12,6 +12,9 @@ from cpython.ref cimport PyObject
 
 from bareduckdb.core.impl.result cimport _ResultBase
 
+# Prepared statements kept per connection for repeated parameterized queries
+cdef size_t _STMT_CACHE_CAPACITY = 128
+
 cdef class ConnectionImpl:
     """
     DuckDB database connection.
@@ -20,6 +23,7 @@ cdef class ConnectionImpl:
     def __cinit__(self, database=None, config=None, read_only=False):
         self._closed = False
         self._cpp_conn = NULL
+        self._stmt_cache = create_prepared_statement_cache(_STMT_CACHE_CAPACITY)
 
         # Use NULL (empty string) for truly private in-memory database
         if database is None:
@@ -104,7 +108,8 @@ cdef class ConnectionImpl:
             raise RuntimeError("Failed to get C++ connection")
 
     def call_impl(
-        self, *, str query, str mode, uint64_t batch_size, object parameters=None
+        self, *, str query, str mode, uint64_t batch_size, object parameters=None,
+        bint cache_statement=True
     ):
         """
         Execute SQL query with specified execution mode.
@@ -117,6 +122,7 @@ cdef class ConnectionImpl:
                   - "stream": Streaming chunks
             batch_size: Arrow record batch size
             parameters: Query parameters (list or dict) - experimental support
+            cache_statement: Reuse the prepared statement for parameterized queries
 
         Returns:
             _ResultBase
@@ -125,11 +131,15 @@ cdef class ConnectionImpl:
             raise RuntimeError("Connection is closed")
 
         return _ResultBase.create(
-            self, query, batch_size, mode, parameters
+            self, query, batch_size, mode, parameters, cache_statement
         )
 
     def close(self):
         """Close the database connection."""
+        # Release cached statements before the connection they were prepared on
+        if self._stmt_cache != NULL:
+            destroy_prepared_statement_cache(self._stmt_cache)
+            self._stmt_cache = NULL
         if not self._closed:
             duckdb_disconnect(&self._conn)
             # Drop our reference to the database
@@ -138,7 +148,7 @@ cdef class ConnectionImpl:
             self._closed = True
 
     def __dealloc__(self):
-        if not self._closed:
+        if not self._closed or self._stmt_cache != NULL:
             self.close()
 
     cdef DuckDBConnection* _get_cpp_connection(self) except +:
@@ -239,7 +249,7 @@ cdef class ConnectionImpl:
         Returns a dict with:
         - statement_type: The type of SQL statement
         - table_refs: List of table names referenced
-        - function_calls: List of table function calls with name, args, kwargs, original_text
+        - function_calls: List of table function calls with name, args, kwargs, original_text, query_location
         - error: True if parsing failed
         - error_message: Error details if parsing failed
         """
@@ -263,6 +273,7 @@ cdef class ConnectionImpl:
                 "args": [arg.decode("utf-8") for arg in func.args],
                 "kwargs": {k.decode("utf-8"): v.decode("utf-8") for k, v in func.kwargs},
                 "original_text": func.original_text.decode("utf-8") if func.original_text.size() > 0 else "",
+                "query_location": func.query_location if func.query_location >= 0 else None,
             })
 
         return py_result
@@ -7,6 +7,7 @@
 #include <cstdint>
 #include <mutex>
 #include <atomic>
+#include <list>
 #include <unordered_map>
 
 #include "duckdb.h"
@@ -1161,13 +1162,61 @@ namespace bareduckdb
     }
 
     // Execute prepared statement with parameters
+    // Per-connection LRU of prepared statements, keyed by query text, so repeated
+    // parameterized queries skip parse/bind/plan. DuckDB rebinds a cached statement
+    // itself when the catalog or parameter types change.
+    class PreparedStatementCache
+    {
+    public:
+        explicit PreparedStatementCache(size_t capacity) : capacity_(capacity) {}
+
+        duckdb::PreparedStatement *Get(const std::string &query)
+        {
+            auto it = index_.find(query);
+            if (it == index_.end())
+                return nullptr;
+            entries_.splice(entries_.begin(), entries_, it->second);
+            return it->second->second.get();
+        }
+
+        duckdb::PreparedStatement *Put(const std::string &query, duckdb::unique_ptr<duckdb::PreparedStatement> stmt)
+        {
+            entries_.emplace_front(query, std::move(stmt));
+            index_[query] = entries_.begin();
+            if (entries_.size() > capacity_)
+            {
+                index_.erase(entries_.back().first);
+                entries_.pop_back();
+            }
+            return entries_.front().second.get();
+        }
+
+    private:
+        using Entry = std::pair<std::string, duckdb::unique_ptr<duckdb::PreparedStatement>>;
+
+        size_t capacity_;
+        std::list<Entry> entries_;
+        std::unordered_map<std::string, std::list<Entry>::iterator> index_;
+    };
+
+    extern "C" void *create_prepared_statement_cache(size_t capacity)
+    {
+        return new PreparedStatementCache(capacity);
+    }
+
+    extern "C" void destroy_prepared_statement_cache(void *cache_ptr)
+    {
+        delete reinterpret_cast<PreparedStatementCache *>(cache_ptr);
+    }
+
     extern "C" duckdb::QueryResult *execute_prepared_statement(
         duckdb_connection c_conn,
         const char *query,
         void *params_map_ptr, // std::map<string, BoundParameterData>*
         bool allow_stream_result,
         bool use_arrow_collector,
-        uint64_t batch_size)
+        uint64_t batch_size,
+        void *stmt_cache_ptr) // PreparedStatementCache*, or NULL to prepare without caching
     {
         try
         {
@@ -1185,20 +1234,27 @@ namespace bareduckdb
                     duckdb::ErrorData("Invalid client context"));
             }
 
-            duckdb::unique_ptr<duckdb::PreparedStatement> stmt = conn->Prepare(query);
-            if (!stmt || !stmt->success)
+            auto *stmt_cache = reinterpret_cast<PreparedStatementCache *>(stmt_cache_ptr);
+            duckdb::unique_ptr<duckdb::PreparedStatement> owned_stmt;
+            duckdb::PreparedStatement *stmt = stmt_cache ? stmt_cache->Get(query) : nullptr;
+            if (!stmt)
             {
-                if (stmt && !stmt->success)
+                owned_stmt = conn->Prepare(query);
+                if (!owned_stmt || !owned_stmt->success)
                 {
-                    // PreparedStatement exists but failed - extract the error
-                    return new duckdb::MaterializedQueryResult(stmt->GetErrorObject());
-                }
-                else
-                {
-                    // stmt is null - create generic error
-                    return new duckdb::MaterializedQueryResult(
-                        duckdb::ErrorData("Prepare failed: statement is null"));
+                    if (owned_stmt && !owned_stmt->success)
+                    {
+                        // PreparedStatement exists but failed - extract the error
+                        return new duckdb::MaterializedQueryResult(owned_stmt->GetErrorObject());
+                    }
+                    else
+                    {
+                        // stmt is null - create generic error
+                        return new duckdb::MaterializedQueryResult(
+                            duckdb::ErrorData("Prepare failed: statement is null"));
+                    }
                 }
+                stmt = stmt_cache ? stmt_cache->Put(query, std::move(owned_stmt)) : owned_stmt.get();
             }
 
             auto *params_map = reinterpret_cast<std::map<std::string, duckdb::BoundParameterData> *>(params_map_ptr);
@@ -1271,6 +1327,7 @@ namespace bareduckdb
         std::vector<std::string> args;
         std::vector<std::pair<std::string, std::string>> kwargs;
         std::string original_text;
+        int64_t query_location = -1; // byte offset of the call in the query text, -1 if unknown
     };
 
     struct ParseResultInfo
@@ -1298,6 +1355,10 @@ namespace bareduckdb
         FunctionCallInfo info;
         info.name = func.function_name;
         info.original_text = func.ToString();
+        if (func.query_location.IsValid())
+        {
+            info.query_location = static_cast<int64_t>(func.query_location.GetIndex());
+        }
 
         for (auto &child : func.children)
         {
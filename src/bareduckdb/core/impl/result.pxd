@@ -22,5 +22,5 @@ cdef class _ResultBase:
     @staticmethod
     cdef _ResultBase create(
         ConnectionImpl connection, str query, uint64_t batch_size,
-        str mode, object parameters=*
+        str mode, object parameters=*, bint cache_statement=*
     )
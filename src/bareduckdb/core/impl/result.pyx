@@ -90,7 +90,7 @@ cdef class _ResultBase:
     @staticmethod
     cdef _ResultBase create(
         ConnectionImpl connection, str query, uint64_t batch_size,
-        str mode, object parameters=None
+        str mode, object parameters=None, bint cache_statement=True
     ):
         """
         Create result by executing query.
@@ -101,6 +101,7 @@ cdef class _ResultBase:
             batch_size: Arrow record batch size
             mode: Execution mode ("arrow", "arrow_capsule", "stream")
             parameters: Query parameters (list or dict)
+            cache_statement: Use the connection's prepared statement cache for parameterized queries
 
         Returns:
             _ResultBase instance
@@ -128,6 +129,7 @@ cdef class _ResultBase:
         cdef bytes query_bytes = query.encode("utf-8")
         cdef const char* c_query = query_bytes
         cdef case_insensitive_map_t param_map
+        cdef void* stmt_cache = NULL
 
         _logger.debug(f"Mode: {mode} (physical_arrow={physical_arrow_collector}, stream={stream})")
 
@@ -136,6 +138,7 @@ cdef class _ResultBase:
             _logger.debug(f"Executing with parameters (count={len(parameters)})")
 
             param_map = transform_parameters(parameters)
+            stmt_cache = connection._stmt_cache if cache_statement else NULL
             _logger.debug("execute_prepared_statement")
 
             with nogil:
@@ -145,7 +148,8 @@ cdef class _ResultBase:
                     <void*>&param_map,
                     stream,
                     physical_arrow_collector,
-                    batch_size
+                    batch_size,
+                    stmt_cache
                 )
 
         elif physical_arrow_collector:
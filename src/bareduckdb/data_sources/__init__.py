@@ -1,10 +1,13 @@
 # Data source abstraction for extensible filter pushdown
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from typing import Callable
+
     import pandas as pd
     import pyarrow as pa
 
@@ -39,22 +42,40 @@ class DataHolder(ABC):
 
 
 def _pandas_to_arrow(df: "pd.DataFrame") -> "pa.Table":
+    import numpy as np
     import pyarrow as pa
 
-    arrays = {}
-    for col in df.columns:
-        arr = df[col].array
+    # from_pandas turns NaN into null: numpy float and object columns keep the per-column pa.array
+    # conversion, which leaves NaN as a value
+    keeps_nan = [isinstance(dtype, np.dtype) and dtype.kind in "fcO" for dtype in df.dtypes]
+    bulk_positions = [i for i, keep in enumerate(keeps_nan) if not keep]
+
+    bulk_columns = None
+    if bulk_positions:
+        try:
+            # C++ converter: zero-copy for numeric and Arrow-backed columns, multithreaded for the rest
+            bulk = pa.Table.from_pandas(df.iloc[:, bulk_positions], preserve_index=False, nthreads=pa.cpu_count())
+            bulk_columns = iter(bulk.columns)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass  # per-column conversion below
+
+    arrays = []
+    for position, keep in enumerate(keeps_nan):
+        if bulk_columns is not None and not keep:
+            arrays.append(next(bulk_columns))
+            continue
+        arr = df.iloc[:, position].array
         if hasattr(arr, "_pa_array"):
-            arrays[col] = arr._pa_array
+            arrays.append(arr._pa_array)
         else:
-            arrays[col] = pa.array(arr)  # type: ignore
+            arrays.append(pa.array(arr, from_pandas=False))  # type: ignore
 
-    return pa.table(arrays)
+    return pa.Table.from_arrays(arrays, names=[str(col) for col in df.columns])
 
 
-def get_holder(data: Any) -> DataHolder | None:
-    type_name = type(data).__name__
-    module = type(data).__module__
+def _resolve_holder_factory(data_type: type) -> Callable[[Any], DataHolder] | None:
+    type_name = data_type.__name__
+    module = data_type.__module__
 
     if type_name == "DataFrame" and module.startswith("polars"):
         try:
@@ -63,31 +84,46 @@ def get_holder(data: Any) -> DataHolder | None:
             from bareduckdb.data_sources.arrow_holder import ArrowHolder
             from bareduckdb.data_sources.polars_holder import _polars_to_arrow
 
-            return ArrowHolder(_polars_to_arrow(data))
+            return lambda data: ArrowHolder(_polars_to_arrow(data))
         except ImportError:
             from bareduckdb.data_sources.polars_holder import PolarsHolder
 
-            return PolarsHolder(data)
+            return PolarsHolder
 
     if type_name == "LazyFrame" and module.startswith("polars"):
         from bareduckdb.data_sources.polars_holder import PolarsLazyHolder
 
-        return PolarsLazyHolder(data)
+        return PolarsLazyHolder
 
     if type_name == "Table" and module.startswith("pyarrow"):
         from bareduckdb.data_sources.arrow_holder import ArrowHolder
 
-        return ArrowHolder(data)
+        return ArrowHolder
 
-    for cls in type(data).__mro__:
-        if cls.__module__.startswith("pyarrow") and "dataset" in cls.__module__.lower():
-            from bareduckdb.data_sources.arrow_holder import ArrowHolder
+    # Datasets (including subclasses from other packages) can only exist once pyarrow's dataset module is loaded
+    pa_dataset = sys.modules.get("pyarrow._dataset")
+    if pa_dataset is not None and issubclass(data_type, pa_dataset.Dataset):
+        from bareduckdb.data_sources.arrow_holder import ArrowHolder
 
-            return ArrowHolder(data)
+        return ArrowHolder
 
     if type_name == "DataFrame" and module.startswith("pandas"):
         from bareduckdb.data_sources.arrow_holder import ArrowHolder
 
-        return ArrowHolder(_pandas_to_arrow(data))
+        return lambda data: ArrowHolder(_pandas_to_arrow(data))
 
     return None
+
+
+# Resolved factory per concrete type (None for unsupported types), so repeated registrations skip the dispatch
+_HOLDER_FACTORIES: dict[type, Callable[[Any], DataHolder] | None] = {}
+
+
+def get_holder(data: Any) -> DataHolder | None:
+    data_type = type(data)
+    try:
+        factory = _HOLDER_FACTORIES[data_type]
+    except KeyError:
+        factory = _HOLDER_FACTORIES[data_type] = _resolve_holder_factory(data_type)
+
+    return factory(data) if factory is not None else None
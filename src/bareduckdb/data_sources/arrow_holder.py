@@ -1,6 +1,9 @@
 # Arrow data holder with native filter pushdown (supports Table and Dataset)
 from __future__ import annotations
 
+import datetime
+from functools import reduce
+from operator import and_, or_
 from typing import TYPE_CHECKING, Any, Union
 
 import pyarrow as pa
@@ -18,20 +21,23 @@ class ArrowHolder(DataHolder):
     Holder for Arrow data sources with native filter pushdown, using dataset for expressions
     """
 
+    # Matches the dataset scanner's default batch size, so unfiltered table scans parallelize the same way
+    _TABLE_BATCH_SIZE = 131_072
+
     def __init__(self, data: Union[pa.Table, ds.Dataset]):
         if isinstance(data, pa.Table):
             self._table: pa.Table | None = data
-            self._dataset = ds.dataset(data)
+            self._dataset: ds.Dataset | None = None  # built on first filtered scan
             self._num_rows: int | None = data.num_rows
+            self._schema = data.schema
         elif isinstance(data, ds.Dataset):
             self._table = None
             self._dataset = data
             self._num_rows = None
+            self._schema = data.schema
         else:
             raise TypeError(f"Expected pa.Table or ds.Dataset, got {type(data)}")
 
-        self._schema = self._dataset.schema
-
     @property
     def schema(self) -> pa.Schema:
         return self._schema
@@ -57,7 +63,16 @@ class ArrowHolder(DataHolder):
         if filters:
             filter_expr = _translate_filters_to_dataset(filters, self._schema.names, self._schema)
 
-        scanner = self._dataset.scanner(
+        if self._table is not None and filter_expr is None:
+            # Projection only: no need for a dataset wrapper
+            table = self._table if projected_columns is None else self._table.select(projected_columns)
+            return table.to_reader(max_chunksize=self._TABLE_BATCH_SIZE).__arrow_c_stream__()
+
+        dataset = self._dataset
+        if dataset is None:
+            dataset = self._dataset = ds.dataset(self._table)
+
+        scanner = dataset.scanner(
             columns=projected_columns,
             filter=filter_expr,
         )
@@ -90,6 +105,10 @@ class _FilterType:
     DYNAMIC_FILTER = 8
 
 
+# Filters that never restrict rows: skipped instead of AND-ing in a literal True
+_NOOP_FILTER_TYPES = frozenset({_FilterType.DYNAMIC_FILTER, _FilterType.OPTIONAL_FILTER})
+
+
 class _ComparisonType:
     EQUAL = 25
     NOT_EQUAL = 26
@@ -103,50 +122,52 @@ class _UnsupportedFilterError(Exception):
     pass
 
 
+# DuckDB pushes DATE filter values as days since the epoch
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+# Filterable types, keyed by type id: one set lookup per filter instead of a pa.types.is_* cascade.
+# Views, decimals, binaries and nested types are left to DuckDB.
+_SUPPORTED_TYPE_IDS = frozenset(
+    t.id
+    for t in (
+        pa.bool_(),
+        pa.int8(),
+        pa.int16(),
+        pa.int32(),
+        pa.int64(),
+        pa.uint8(),
+        pa.uint16(),
+        pa.uint32(),
+        pa.uint64(),
+        pa.float16(),
+        pa.float32(),
+        pa.float64(),
+        pa.string(),
+        pa.large_string(),
+        pa.date32(),
+        pa.date64(),
+        pa.timestamp("us"),  # all units and timezones share one id
+    )
+)
+
+_VIEW_TYPE_IDS = frozenset(
+    t.id
+    for t in (
+        pa.string_view(),
+        pa.binary_view(),
+        *(getattr(pa, name)() for name in ("large_string_view", "large_binary_view") if hasattr(pa, name)),
+    )
+)
+
+
 def _schema_has_view_types(schema: pa.Schema) -> bool:
     """Check if schema contains any view types that PyArrow can't filter."""
-    for field in schema:
-        if field.type == pa.string_view() or field.type == pa.binary_view():
-            return True
-        if hasattr(pa, "large_string_view") and field.type == pa.large_string_view():
-            return True
-        if hasattr(pa, "large_binary_view") and field.type == pa.large_binary_view():
-            return True
-    return False
+    return any(t.id in _VIEW_TYPE_IDS for t in schema.types)
 
 
 def _is_supported_filter_type(column_type: pa.DataType) -> bool:
-    if column_type == pa.string_view() or column_type == pa.binary_view():
-        return False
-    if hasattr(pa, "large_string_view") and column_type == pa.large_string_view():
-        return False
-    if hasattr(pa, "large_binary_view") and column_type == pa.large_binary_view():
-        return False
-    if pa.types.is_decimal(column_type):
-        return False
-    if pa.types.is_binary(column_type) or pa.types.is_large_binary(column_type):
-        return False
-    if pa.types.is_struct(column_type):
-        return False
-    if pa.types.is_list(column_type) or pa.types.is_large_list(column_type):
-        return False
-    if pa.types.is_map(column_type):
-        return False
-
-    if pa.types.is_boolean(column_type):
-        return True
-    if pa.types.is_integer(column_type):
-        return True
-    if pa.types.is_floating(column_type):
-        return True
-    if pa.types.is_string(column_type) or pa.types.is_large_string(column_type):
-        return True
-    if pa.types.is_date(column_type):
-        return True
-    if pa.types.is_timestamp(column_type):
-        return True
-
-    return False
+    return column_type.id in _SUPPORTED_TYPE_IDS
 
 
 def _translate_filters_to_dataset(
@@ -158,13 +179,15 @@ def _translate_filters_to_dataset(
         return None
 
     result: ds.Expression | None = None
+    # column_names follow schema order: index types positionally rather than scanning by name
+    types = schema.types
 
     for col_idx, filter_info in filters.items():
-        if col_idx >= len(column_names):
+        if col_idx >= len(column_names) or filter_info.get("type") in _NOOP_FILTER_TYPES:
             continue
 
         column_name = column_names[col_idx]
-        column_type = schema.field(column_name).type
+        column_type = types[col_idx]
         if not _is_supported_filter_type(column_type):
             continue
 
@@ -208,24 +231,26 @@ def _translate_single_filter(
         children = filter_info.get("children", [])
         if not children:
             return ds.scalar(True)
-        result = _translate_single_filter(children[0], column_name, column_type)
-        for child in children[1:]:
-            result = result & _translate_single_filter(child, column_name, column_type)
-        return result
+        return reduce(and_, (_translate_single_filter(child, column_name, column_type) for child in children))
 
     elif filter_type == _FilterType.CONJUNCTION_OR:
         children = filter_info.get("children", [])
         if not children:
             return ds.scalar(False)
-        result = _translate_single_filter(children[0], column_name, column_type)
-        for child in children[1:]:
-            result = result | _translate_single_filter(child, column_name, column_type)
-        return result
+        return reduce(or_, (_translate_single_filter(child, column_name, column_type) for child in children))
 
     elif filter_type == _FilterType.IN_FILTER:
         values = filter_info.get("values", [])
         if not values:
             return ds.scalar(False)
+        if not (pa.types.is_date(column_type) or pa.types.is_timestamp(column_type)):
+            # No per-value massaging needed: let Arrow convert the whole list at once
+            if any(v is None for v in values):
+                raise _UnsupportedFilterError(f"IN filter has unsupported values for {column_name}")
+            try:
+                return field.isin(pa.array(values, type=column_type, from_pandas=False))
+            except (pa.ArrowException, OverflowError):
+                pass
         converted_values = [_convert_value_for_type(v, column_type) for v in values]
         if any(v is None for v in converted_values):
             raise _UnsupportedFilterError(f"IN filter has unsupported values for {column_name}")
@@ -242,14 +267,12 @@ def _translate_single_filter(
 
 
 def _convert_value_for_type(value: Any, column_type: pa.DataType) -> Any:
-    import datetime
-
     if value is None:
         return None
 
     if pa.types.is_date(column_type):
         if isinstance(value, int):
-            return datetime.date.fromordinal(datetime.date(1970, 1, 1).toordinal() + value)
+            return datetime.date.fromordinal(_EPOCH_ORDINAL + value)
         return value
 
     if pa.types.is_timestamp(column_type):
@@ -268,15 +291,6 @@ def _convert_value_for_type(value: Any, column_type: pa.DataType) -> Any:
     return value
 
 
-def _is_nan(value: Any) -> bool:
-    """Check if a value is NaN."""
-    import math
-
-    if isinstance(value, float):
-        return math.isnan(value)
-    return False
-
-
 def _apply_comparison(
     field: ds.Expression,
     comparison: int,
@@ -292,23 +306,23 @@ def _apply_comparison(
     if converted_value is None:
         raise _UnsupportedFilterError(f"Failed to convert value for column {column_name}")
 
-    # Special handling for NaN comparisons on float columns to match DuckDB
-    if pa.types.is_floating(column_type) and _is_nan(converted_value):
+    # Special handling for NaN comparisons on float columns to match DuckDB (NaN is the only value != itself)
+    if pa.types.is_floating(column_type) and isinstance(converted_value, float) and converted_value != converted_value:
         if comparison == _ComparisonType.EQUAL:
             # NaN == NaN should be true
-            return pc.is_nan(ds.field(column_name))
+            return pc.is_nan(field)
         elif comparison == _ComparisonType.NOT_EQUAL:
             # NaN != NaN should be false, non-NaN != NaN should be true
-            return ~pc.is_nan(ds.field(column_name))
+            return ~pc.is_nan(field)
         elif comparison == _ComparisonType.GREATER_THAN:
             # Nothing is > NaN
             return ds.scalar(False)
         elif comparison == _ComparisonType.LESS_THAN:
             # All non-NaN values are < NaN
-            return ~pc.is_nan(ds.field(column_name))
+            return ~pc.is_nan(field)
         elif comparison == _ComparisonType.GREATER_THAN_OR_EQUAL:
             # Only NaN is >= NaN
-            return pc.is_nan(ds.field(column_name))
+            return pc.is_nan(field)
         elif comparison == _ComparisonType.LESS_THAN_OR_EQUAL:
             # Everything is <= NaN
             return ds.scalar(True)
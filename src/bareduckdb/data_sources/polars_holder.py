@@ -3,16 +3,25 @@ from __future__ import annotations
 
 import logging
 import math
+import operator
+import weakref
 from typing import TYPE_CHECKING, Any
 
 import polars as pl
 
 from . import DataHolder
 
+try:
+    import pyarrow as _pa
+except ImportError:  # the Polars holders work without pyarrow: only schema and Arrow conversion need it
+    _pa = None
+
 logger = logging.getLogger(__name__)
 
 
 if TYPE_CHECKING:
+    from typing import Callable
+
     import pyarrow as pa
 
 
@@ -20,12 +29,20 @@ def _polars_to_arrow(df: pl.DataFrame) -> "pa.Table":
     return df.to_arrow(compat_level=pl.CompatLevel.newest())
 
 
+# Matches ArrowHolder's table batch size
+_STREAM_BATCH_ROWS = 131_072
+
+
 def _df_to_capsule(df: pl.DataFrame) -> Any:
-    try:
-        return df.to_arrow(compat_level=pl.CompatLevel.newest()).__arrow_c_stream__()
-    except ImportError:
+    if _pa is None:
         return df.__arrow_c_stream__()
 
+    # Convert slice by slice as DuckDB pulls batches, rather than building the whole Arrow table up front
+    compat_level = pl.CompatLevel.newest()
+    schema = df.head(0).to_arrow(compat_level=compat_level).schema
+    batches = (batch for part in df.iter_slices(n_rows=_STREAM_BATCH_ROWS) for batch in part.to_arrow(compat_level=compat_level).to_batches())
+    return _pa.RecordBatchReader.from_batches(schema, batches).__arrow_c_stream__()
+
 
 class PolarsHolder(DataHolder):
     """
@@ -37,12 +54,18 @@ class PolarsHolder(DataHolder):
         self._df = df
         self._column_names = df.columns
         self._num_rows = len(df)
+        self._col_exprs = [pl.col(name) for name in self._column_names]
+        self._filter_cache: dict[Any, pl.Expr | None] = {}
+        self._schema: pa.Schema | None = None
+        self._empty_df = df.head(0)  # zero-copy; exported for schema-only scans
 
     @property
     def schema(self) -> "pa.Schema":
-        import pyarrow as pa
-
-        return pa.RecordBatchReader._import_from_c_capsule(self._df.head(0).__arrow_c_stream__()).schema
+        if self._schema is None:
+            if _pa is None:
+                raise ImportError("pyarrow is required for the Arrow schema of a Polars source")
+            self._schema = _pa.RecordBatchReader.from_stream(self._empty_df).schema
+        return self._schema
 
     @property
     def num_rows(self) -> int:
@@ -58,13 +81,13 @@ class PolarsHolder(DataHolder):
         filters: dict[int, dict[str, Any]] | None,
     ) -> Any:
         if projected_columns is None and filters is None:
-            return self._df.head(0).__arrow_c_stream__()
+            return self._empty_df.__arrow_c_stream__()
 
         df = self._df
 
         # Apply filters using Polars expressions
         if filters:
-            filter_expr = _translate_filters_to_polars(filters, self._column_names)
+            filter_expr = _cached_filter_expr(self._filter_cache, filters, self._col_exprs)
             if filter_expr is not None:
                 df = df.filter(filter_expr)
 
@@ -84,23 +107,56 @@ class PolarsHolder(DataHolder):
             return []
 
 
+class _Collected:
+    """A LazyFrame's collected result, shared by every holder registered for that LazyFrame."""
+
+    __slots__ = ("lf_ref", "df", "__weakref__")
+
+    def __init__(self, lf: pl.LazyFrame, df: pl.DataFrame):
+        self.lf_ref = weakref.ref(lf)
+        self.df = df
+
+
+# Keyed by id(lf); entries live while a holder references them. lf_ref guards against id reuse.
+_COLLECTED: weakref.WeakValueDictionary[int, _Collected] = weakref.WeakValueDictionary()
+
+
+def _is_in_memory_plan(lf: pl.LazyFrame) -> bool:
+    """True for a bare DataFrame.lazy(): the unoptimized plan is a single in-memory DF scan."""
+    try:
+        plan = lf.explain(optimized=False)
+    except Exception:
+        return False
+    return plan.startswith("DF ") and "\n" not in plan
+
+
 class PolarsLazyHolder(DataHolder):
     def __init__(self, lf: pl.LazyFrame):
         self._lf = lf
         self._schema_dict = lf.collect_schema()
         self._column_names = list(self._schema_dict.keys())
-        self._cached_df: pl.DataFrame | None = None
+        self._collected: _Collected | None = None
+        self._col_exprs = [pl.col(name) for name in self._column_names]
+        self._filter_cache: dict[Any, pl.Expr | None] = {}
+
+        # Collecting a wrapped DataFrame is free, and spares every filtered scan a plan re-execution
+        self._eager: PolarsHolder | None = PolarsHolder(lf.collect()) if _is_in_memory_plan(lf) else None
+        self._schema: pa.Schema | None = None
+        # Built from the collected schema: exports the same Arrow types as head(0).collect() without running the plan
+        self._empty_df = pl.DataFrame(schema=self._schema_dict)
 
     @property
     def schema(self) -> "pa.Schema":
-        import pyarrow as pa
-
-        return pa.RecordBatchReader._import_from_c_capsule(self._lf.head(0).collect().__arrow_c_stream__()).schema
+        if self._schema is None:
+            if _pa is None:
+                raise ImportError("pyarrow is required for the Arrow schema of a Polars source")
+            self._schema = _pa.RecordBatchReader.from_stream(self._empty_df).schema
+        return self._schema
 
     @property
     def num_rows(self) -> int | None:
         # Don't collect LazyFrame just for row count - return None
-        return None
+        return self._eager.num_rows if self._eager is not None else None
 
     @property
     def column_names(self) -> list[str]:
@@ -111,21 +167,30 @@ class PolarsLazyHolder(DataHolder):
         projected_columns: list[str] | None,
         filters: dict[int, dict[str, Any]] | None,
     ) -> Any:
+        if self._eager is not None:
+            return self._eager.produce_filtered(projected_columns, filters)
+
         if projected_columns is None and filters is None:
-            return self._lf.head(0).collect().__arrow_c_stream__()
+            return self._empty_df.__arrow_c_stream__()
 
         lf = self._lf
         filters_pushed = False
 
         # Apply filters to lazy plan
         if filters:
-            filter_expr = _translate_filters_to_polars(filters, self._column_names)
+            filter_expr = _cached_filter_expr(self._filter_cache, filters, self._col_exprs)
             if filter_expr is not None:
                 lf = lf.filter(filter_expr)
                 filters_pushed = True
 
-        if not filters_pushed and self._cached_df is not None:
-            df = self._cached_df
+        if not filters_pushed and self._collected is None:
+            # Another registration of the same LazyFrame may have collected it already
+            entry = _COLLECTED.get(id(self._lf))
+            if entry is not None and entry.lf_ref() is self._lf:
+                self._collected = entry
+
+        if not filters_pushed and self._collected is not None:
+            df = self._collected.df
             if projected_columns:
                 df = df.select(projected_columns)
             return _df_to_capsule(df)
@@ -133,7 +198,7 @@ class PolarsLazyHolder(DataHolder):
         df = lf.collect()
 
         if not filters_pushed:
-            self._cached_df = df
+            self._collected = _COLLECTED[id(self._lf)] = _Collected(self._lf, df)
 
         # Apply projection
         if projected_columns:
@@ -159,6 +224,10 @@ class _FilterType:
     DYNAMIC_FILTER = 8
 
 
+# Filters that never restrict rows: skipped instead of AND-ing in a literal True
+_NOOP_FILTER_TYPES = frozenset({_FilterType.DYNAMIC_FILTER, _FilterType.OPTIONAL_FILTER})
+
+
 # Comparison type constants (match DuckDB ExpressionType enum)
 class _ComparisonType:
     EQUAL = 25
@@ -169,41 +238,76 @@ class _ComparisonType:
     GREATER_THAN_OR_EQUAL = 30
 
 
+_FILTER_CACHE_SIZE = 128
+
+
+def _filter_key(obj: Any) -> Any:
+    """Hashable form of a pushed-down filter; scalars keep their type so 1, 1.0 and True stay distinct."""
+    if isinstance(obj, dict):
+        return tuple(sorted((k, _filter_key(v)) for k, v in obj.items()))
+    if isinstance(obj, (list, tuple)):
+        return tuple(_filter_key(v) for v in obj)
+    return (type(obj), obj)
+
+
+def _cached_filter_expr(
+    cache: dict[Any, pl.Expr | None],
+    filters: dict[int, dict[str, Any]],
+    col_exprs: list[pl.Expr],
+) -> pl.Expr | None:
+    """Translate filters through a per-holder cache: repeated scans push down the same filters."""
+    try:
+        key = _filter_key(filters)
+        hash(key)
+    except TypeError:  # unhashable filter value
+        return _translate_filters_to_polars(filters, col_exprs)
+
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+
+    expr = _translate_filters_to_polars(filters, col_exprs)
+    if len(cache) >= _FILTER_CACHE_SIZE:
+        cache.pop(next(iter(cache)))  # FIFO eviction
+    cache[key] = expr
+    return expr
+
+
 def _translate_filters_to_polars(
     filters: dict[int, dict[str, Any]],
-    column_names: list[str],
+    col_exprs: list[pl.Expr],
 ) -> pl.Expr | None:
-    """Translate DuckDB filters to Polars expression."""
+    """Translate DuckDB filters to Polars expression, given the holder's pl.col() per column."""
     if not filters:
         return None
 
-    result: pl.Expr | None = None
+    exprs: list[pl.Expr] = []
 
     for col_idx, filter_info in filters.items():
-        if col_idx >= len(column_names):
+        if col_idx >= len(col_exprs) or filter_info.get("type") in _NOOP_FILTER_TYPES:
             continue
 
-        column_name = column_names[col_idx]
         try:
-            expr = _translate_single_filter(filter_info, column_name)
-            if result is None:
-                result = expr
-            else:
-                result = result & expr
+            exprs.append(_translate_single_filter(filter_info, col_exprs[col_idx]))
         except (KeyError, TypeError, ValueError) as e:
-            logger.debug("Failed to translate filter for column %s: %s", column_name, e)
+            logger.debug("Failed to translate filter for column %d: %s", col_idx, e)
             continue
 
-    return result
+    return _combine(exprs, pl.all_horizontal) if exprs else None
+
+
+def _combine(exprs: list[pl.Expr], combinator: Callable[[list[pl.Expr]], pl.Expr]) -> pl.Expr:
+    """One N-ary AND/OR node (same Kleene null semantics as chained &/|) instead of N-1 binary nodes."""
+    return exprs[0] if len(exprs) == 1 else combinator(exprs)
 
 
 def _translate_single_filter(
     filter_info: dict[str, Any],
-    column_name: str,
+    col: pl.Expr,
 ) -> pl.Expr:
     """Translate a single filter to Polars expression."""
     filter_type = filter_info["type"]
-    col = pl.col(column_name)
 
     if filter_type == _FilterType.CONSTANT_COMPARISON:
         comparison = filter_info["comparison"]
@@ -225,19 +329,13 @@ def _translate_single_filter(
         children = filter_info.get("children", [])
         if not children:
             return pl.lit(True)
-        result = _translate_single_filter(children[0], column_name)
-        for child in children[1:]:
-            result = result & _translate_single_filter(child, column_name)
-        return result
+        return _combine([_translate_single_filter(child, col) for child in children], pl.all_horizontal)
 
     elif filter_type == _FilterType.CONJUNCTION_OR:
         children = filter_info.get("children", [])
         if not children:
             return pl.lit(False)
-        result = _translate_single_filter(children[0], column_name)
-        for child in children[1:]:
-            result = result | _translate_single_filter(child, column_name)
-        return result
+        return _combine([_translate_single_filter(child, col) for child in children], pl.any_horizontal)
 
     elif filter_type == _FilterType.STRUCT_EXTRACT:
         child_idx = filter_info["child_idx"]
@@ -263,40 +361,36 @@ def _translate_single_filter(
         return pl.lit(True)
 
 
+# NaN sorts above every other value in DuckDB
+_NAN_COMPARISONS: dict[int, Callable[[pl.Expr], pl.Expr]] = {
+    _ComparisonType.EQUAL: lambda col: col.is_nan(),
+    _ComparisonType.NOT_EQUAL: lambda col: ~col.is_nan(),
+    _ComparisonType.GREATER_THAN_OR_EQUAL: lambda col: col.is_nan(),
+    _ComparisonType.LESS_THAN: lambda col: ~col.is_nan(),
+    _ComparisonType.GREATER_THAN: lambda col: pl.lit(False),
+    _ComparisonType.LESS_THAN_OR_EQUAL: lambda col: pl.lit(True),
+}
+
+_COMPARISON_OPS: dict[int, Callable[[pl.Expr, Any], pl.Expr]] = {
+    _ComparisonType.EQUAL: operator.eq,
+    _ComparisonType.NOT_EQUAL: operator.ne,
+    _ComparisonType.LESS_THAN: operator.lt,
+    _ComparisonType.LESS_THAN_OR_EQUAL: operator.le,
+    _ComparisonType.GREATER_THAN: operator.gt,
+    _ComparisonType.GREATER_THAN_OR_EQUAL: operator.ge,
+}
+
+
 def _translate_nan_comparison(comparison: int, col: pl.Expr) -> pl.Expr:
     """Handle comparisons with NaN value."""
-    if comparison == _ComparisonType.EQUAL:
-        return col.is_nan()
-    elif comparison == _ComparisonType.NOT_EQUAL:
-        return ~col.is_nan()
-    elif comparison == _ComparisonType.GREATER_THAN_OR_EQUAL:
-        return col.is_nan()
-    elif comparison == _ComparisonType.LESS_THAN:
-        return ~col.is_nan()
-    elif comparison == _ComparisonType.GREATER_THAN:
-        return pl.lit(False)
-    elif comparison == _ComparisonType.LESS_THAN_OR_EQUAL:
-        return pl.lit(True)
-    else:
-        return pl.lit(True)
+    translate = _NAN_COMPARISONS.get(comparison)
+    return translate(col) if translate is not None else pl.lit(True)
 
 
 def _apply_comparison(col: pl.Expr, comparison: int, value: Any) -> pl.Expr:
     """Apply comparison operator."""
-    if comparison == _ComparisonType.EQUAL:
-        return col == value
-    elif comparison == _ComparisonType.NOT_EQUAL:
-        return col != value
-    elif comparison == _ComparisonType.LESS_THAN:
-        return col < value
-    elif comparison == _ComparisonType.LESS_THAN_OR_EQUAL:
-        return col <= value
-    elif comparison == _ComparisonType.GREATER_THAN:
-        return col > value
-    elif comparison == _ComparisonType.GREATER_THAN_OR_EQUAL:
-        return col >= value
-    else:
-        return pl.lit(True)
+    op = _COMPARISON_OPS.get(comparison)
+    return op(col, value) if op is not None else pl.lit(True)
 
 
 def _translate_filter_with_expr(filter_info: dict[str, Any], expr: pl.Expr) -> pl.Expr:
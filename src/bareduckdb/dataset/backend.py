@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 import re
 import threading
@@ -76,18 +77,16 @@ def register_table(
 
     conn_impl = _get_connection_impl(connection_base)
 
-    with _data_source_registration_lock:
-        if not hasattr(connection_base, "_python_data_functions_registered"):
-            try:
-                register_scan_function_pyx(conn_impl, "python_data_scan")
-                connection_base._python_data_functions_registered = True
-            except RuntimeError as e:
-                if "already exists" not in str(e):
-                    raise
-                connection_base._python_data_functions_registered = True
-
-    if not hasattr(connection_base, "_holder_factories"):
-        connection_base._holder_factories = {}
+    if not connection_base._python_data_functions_registered:
+        with _data_source_registration_lock:
+            if not connection_base._python_data_functions_registered:
+                try:
+                    register_scan_function_pyx(conn_impl, "python_data_scan")
+                    connection_base._python_data_functions_registered = True
+                except RuntimeError as e:
+                    if "already exists" not in str(e):
+                        raise
+                    connection_base._python_data_functions_registered = True
 
     if replace and name in connection_base._holder_factories:
         old_factory_ptr, old_holder = connection_base._holder_factories.pop(name)
@@ -134,7 +133,7 @@ def _get_numeric_columns(data: SchemaData) -> list[str]:
 
     numeric_cols = []
     for name, dtype in data.schema.items():
-        if dtype in _polars_numeric_types():
+        if dtype.base_type() in _polars_numeric_types():
             numeric_cols.append(name)
     return numeric_cols
 
@@ -213,35 +212,27 @@ def _make_stats_tuple(
     return (idx, type_tag, null_count, num_rows, min_int, max_int, min_double, max_double, max_str_len, min_str, max_str)
 
 
-def _polars_int_types() -> tuple:
+# Polars dtype sets, built on first use so polars stays an optional import.
+# Members are base classes: look up dtype.base_type() so parameterized types like Datetime("ns", "UTC") match.
+@functools.cache
+def _polars_int_types() -> frozenset:
     import polars as pl
 
-    return (pl.Int8, pl.Int16, pl.Int32, pl.Int64, pl.UInt8, pl.UInt16, pl.UInt32, pl.UInt64)
+    return frozenset((pl.Int8, pl.Int16, pl.Int32, pl.Int64, pl.UInt8, pl.UInt16, pl.UInt32, pl.UInt64))
 
 
-def _polars_float_types() -> tuple:
+@functools.cache
+def _polars_float_types() -> frozenset:
     import polars as pl
 
-    return (pl.Float32, pl.Float64)
+    return frozenset((pl.Float32, pl.Float64))
 
 
-def _polars_numeric_types() -> tuple:
+@functools.cache
+def _polars_numeric_types() -> frozenset:
     import polars as pl
 
-    return (
-        pl.Int8,
-        pl.Int16,
-        pl.Int32,
-        pl.Int64,
-        pl.UInt8,
-        pl.UInt16,
-        pl.UInt32,
-        pl.UInt64,
-        pl.Float32,
-        pl.Float64,
-        pl.Date,
-        pl.Datetime,
-    )
+    return _polars_int_types() | _polars_float_types() | {pl.Date, pl.Datetime}
 
 
 def compute_statistics(data: Any, statistics: StatisticsType) -> list[tuple] | None:
@@ -292,45 +283,66 @@ def _compute_statistics_polars(df: Any, statistics: StatisticsType) -> list[tupl
         return []
     col_names = df.columns if resolved is True else resolved
 
-    results = []
-
-    for name in col_names:
-        if name not in df.columns:
+    schema = df.schema
+    col_indexes = {name: idx for idx, name in enumerate(df.columns)}
+    int_types = _polars_int_types()
+    float_types = _polars_float_types()
+    stat_types = int_types | float_types | {pl.String, pl.Date, pl.Datetime}
+
+    # One select computes every aggregate, so Polars runs them together instead of one reduction per call
+    targets = []
+    aggs = []
+    for i, name in enumerate(col_names):
+        if name not in col_indexes:
             raise ValueError(f"Column '{name}' not found. Available: {df.columns}")
 
-        idx = df.columns.index(name)
-        col = df[name]
-        dtype = col.dtype
-        null_count = col.null_count()
-        num_rows = df.height
+        dtype = schema[name].base_type()
+        col = pl.col(name)
+        targets.append((i, col_indexes[name], dtype))
+        aggs.append(col.null_count().alias(f"{i}_nulls"))
+        if dtype in stat_types:
+            aggs.append(col.min().alias(f"{i}_min"))
+            aggs.append(col.max().alias(f"{i}_max"))
+        if dtype in float_types:
+            aggs.append(col.is_nan().any().alias(f"{i}_nan"))
+        elif dtype is pl.String:
+            aggs.append(col.str.len_bytes().max().alias(f"{i}_len"))
+
+    stats = df.select(aggs).row(0, named=True)
+    num_rows = df.height
+
+    results = []
+
+    for i, idx, dtype in targets:
+        null_count = stats[f"{i}_nulls"]
 
         if null_count == num_rows:
             results.append(_make_stats_tuple(idx, "null", null_count, num_rows))
             continue
 
-        if dtype in _polars_float_types():
-            if col.is_nan().any():
-                continue
+        if stats.get(f"{i}_nan"):
+            continue
 
-        min_val = col.min()
-        max_val = col.max()
+        min_val = stats.get(f"{i}_min")
+        max_val = stats.get(f"{i}_max")
 
         if min_val is None or max_val is None:
-            results.append(_make_stats_tuple(idx, "null", null_count, num_rows))
+            if f"{i}_min" in stats:
+                results.append(_make_stats_tuple(idx, "null", null_count, num_rows))
             continue
 
-        if dtype in _polars_int_types():
+        if dtype in int_types:
             results.append(_make_stats_tuple(idx, "int", null_count, num_rows, min_int=int(min_val), max_int=int(max_val)))
-        elif dtype in _polars_float_types():
+        elif dtype in float_types:
             results.append(_make_stats_tuple(idx, "float", null_count, num_rows, min_double=float(min_val), max_double=float(max_val)))
-        elif dtype in (pl.Utf8, pl.String):
-            max_len = col.str.len_bytes().max() or 0
+        elif dtype is pl.String:
+            max_len = stats[f"{i}_len"] or 0
             results.append(_make_stats_tuple(idx, "str", null_count, num_rows, max_str_len=max_len, min_str=str(min_val), max_str=str(max_val)))
-        elif dtype == pl.Date:
+        elif dtype is pl.Date:
             min_days = (min_val - date(1970, 1, 1)).days
             max_days = (max_val - date(1970, 1, 1)).days
             results.append(_make_stats_tuple(idx, "int", null_count, num_rows, min_int=min_days, max_int=max_days))
-        elif dtype == pl.Datetime:
+        elif dtype is pl.Datetime:
             min_us = int(min_val.timestamp() * 1_000_000)
             max_us = int(max_val.timestamp() * 1_000_000)
             results.append(_make_stats_tuple(idx, "int", null_count, num_rows, min_int=min_us, max_int=max_us))
@@ -350,50 +362,86 @@ def _compute_statistics_arrow(table: "pa.Table", statistics: StatisticsType) ->
     resolved = _resolve_statistics_columns(table, statistics)
     if not resolved:
         return []
-    col_names = table.schema.names if resolved is True else resolved
-
-    results = []
+    schema = table.schema
+    col_indexes = {name: idx for idx, name in enumerate(schema.names)}
+    col_names = schema.names if resolved is True else resolved
+
+    # Aggregates for every column run as one scalar group_by plan instead of one kernel call per column.
+    # Inputs get positional names so the output columns can't collide with user column names.
+    targets = []
+    agg_arrays = []
+    aggs = []
     for name in col_names:
-        if name not in table.schema.names:
-            raise ValueError(f"Column '{name}' not found. Available: {table.schema.names}")
+        if name not in col_indexes:
+            raise ValueError(f"Column '{name}' not found. Available: {schema.names}")
 
-        idx = table.schema.get_field_index(name)
+        idx = col_indexes[name]
         col = table.column(idx)
-        field = table.schema.field(idx)
+        field = schema.field(idx)
 
         if field.type in (pa.string_view(), pa.binary_view()):
             continue
 
         null_count = col.null_count
         num_rows = len(col)
+        key = f"c{len(targets)}"
+        targets.append((key, idx, field.type, null_count, num_rows))
 
         if null_count == num_rows:
-            results.append(_make_stats_tuple(idx, "null", null_count, num_rows))
             continue
 
+        is_string = pa.types.is_string(field.type) or pa.types.is_large_string(field.type)
+        if (
+            pa.types.is_integer(field.type)
+            or pa.types.is_floating(field.type)
+            or is_string
+            or pa.types.is_date(field.type)
+            or pa.types.is_timestamp(field.type)
+        ):
+            agg_arrays.append((key, col))
+            aggs.append((key, "min_max"))
         if pa.types.is_floating(field.type):
-            if pc.any(pc.is_nan(col)).as_py():
-                continue
+            agg_arrays.append((f"{key}_nan", pc.is_nan(col)))
+            aggs.append((f"{key}_nan", "any"))
+        elif is_string:
+            agg_arrays.append((f"{key}_len", pc.utf8_length(col)))
+            aggs.append((f"{key}_len", "max"))
+
+    stats: dict[str, Any] = {}
+    if aggs:
+        agg_table = pa.table(dict(agg_arrays))
+        stats = agg_table.group_by([]).aggregate(aggs).to_pylist()[0]
 
-        minmax = pc.min_max(col).as_py()
-        min_val, max_val = minmax["min"], minmax["max"]  # type: ignore
+    results = []
+    for key, idx, col_type, null_count, num_rows in targets:
+        if null_count == num_rows:
+            results.append(_make_stats_tuple(idx, "null", null_count, num_rows))
+            continue
+
+        if stats.get(f"{key}_nan_any"):
+            continue
+
+        minmax = stats.get(f"{key}_min_max")
+        if minmax is None:
+            continue
+        min_val, max_val = minmax["min"], minmax["max"]
 
         if min_val is None or max_val is None:
             results.append(_make_stats_tuple(idx, "null", null_count, num_rows))
             continue
 
-        if pa.types.is_integer(field.type):
+        if pa.types.is_integer(col_type):
             results.append(_make_stats_tuple(idx, "int", null_count, num_rows, min_int=int(min_val), max_int=int(max_val)))
-        elif pa.types.is_floating(field.type):
+        elif pa.types.is_floating(col_type):
             results.append(_make_stats_tuple(idx, "float", null_count, num_rows, min_double=float(min_val), max_double=float(max_val)))
-        elif pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
-            max_len = pc.max(pc.utf8_length(col)).as_py() or 0
+        elif pa.types.is_string(col_type) or pa.types.is_large_string(col_type):
+            max_len = stats[f"{key}_len_max"] or 0
             results.append(_make_stats_tuple(idx, "str", null_count, num_rows, max_str_len=max_len, min_str=str(min_val), max_str=str(max_val)))
-        elif pa.types.is_date(field.type):
+        elif pa.types.is_date(col_type):
             min_days = (min_val - date(1970, 1, 1)).days
             max_days = (max_val - date(1970, 1, 1)).days
             results.append(_make_stats_tuple(idx, "int", null_count, num_rows, min_int=min_days, max_int=max_days))
-        elif pa.types.is_timestamp(field.type):
+        elif pa.types.is_timestamp(col_type):
             min_us = int(min_val.timestamp() * 1_000_000)
             max_us = int(max_val.timestamp() * 1_000_000)
             results.append(_make_stats_tuple(idx, "int", null_count, num_rows, min_int=min_us, max_int=max_us))
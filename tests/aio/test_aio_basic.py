@@ -13,9 +13,11 @@ async def test_single():
 async def test_multiple():
     async with AsyncConnectionPool() as pool:
 
-        tasks = [pool.execute("select * from range(?)", parameters=(i,)) for i in range(10)]
+        # Same query text on every task: each pooled connection reuses its prepared statement
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(pool.execute("select * from range(?)", parameters=(i,))) for i in range(10)]
 
-        results = await asyncio.gather(*tasks)
+        results = [task.result() for task in tasks]
         assert len(results)==10
         assert len(results[-2]) == 8
 
@@ -4,18 +4,20 @@
 import sys
 from pathlib import Path
 
-import bareduckdb
+import pyarrow as pa
+import pyarrow.compute as pc
 
+import bareduckdb
 
-def main():
-    results_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("benchmark-results")
 
-    query = rf"""
+# The results glob is bound as a parameter, so paths need no quoting
+LOAD_SQL = """
     create or replace table all_results_raw as
     select *
-    from read_json('RESULTS_DIR/*.jsonl', filename=True, ignore_errors=true);
-
+    from read_json($results_glob, filename=True, ignore_errors=true)
+"""
 
+REPORT_SQL = """
     create or replace table all_results as
     select * exclude (timestamp, nodeid),
         coalesce(test_run, 1) as test_run,
@@ -24,11 +26,13 @@ def main():
             when library = 'bareduckdb' and 'dev' in lib_version then 'bareduckdb_dev'
             else library
         end as lib,
+        -- xdist workers write one file each (..._gw0.jsonl): they belong to the same run
+        regexp_replace(filename, '_gw[0-9]+[.]jsonl$', '.jsonl') as run_file,
     from all_results_raw;
 
     create or replace table latest_results as
-    select * from all_results where filename in
-    (select max(filename) from all_results group by lib, lib_version)
+    select * from all_results where run_file in
+    (select max(run_file) from all_results group by lib, lib_version)
     ;
     create or replace table result_stats as
     select
@@ -58,37 +62,58 @@ def main():
     ;
 
 
-    with time_pivoted as (
-    pivot result_vs_baseline on lib using round(last(time_ms_avg), 1) as time_ms_avg, round(last(ms_ratio),2) as time group by test_name, mode
-    ),
-    mem_pivoted as (
-    pivot result_vs_baseline on lib using round(last(mem_peak_ratio),1) as mem group by test_name, mode
+    with pivoted as (
+    pivot result_vs_baseline on lib using round(last(time_ms_avg), 1) as time_ms_avg, round(last(ms_ratio),2) as time, round(last(mem_peak_ratio),1) as mem group by test_name, mode
     )
     select b.test_name as test,
         b.mode,
         round(b.time_ms_avg,1) base_ms,
         -- round(b.memory_kb_delta,1) base_kb,
         -- round(b.memory_kb_peak,1) base_kb,
-        t.* exclude (test_name, mode),
-        m.* exclude (test_name, mode)
+        p.* exclude (test_name, mode)
     from baseline b
-    join mem_pivoted m on m.test_name=b.test_name and m.mode=b.mode
-    join time_pivoted t on t.test_name=b.test_name and t.mode=b.mode
+    join pivoted p on p.test_name=b.test_name and p.mode=b.mode
     order by b.test_name, b.mode
-    """.replace("RESULTS_DIR", str(results_dir))
+    """
+
+CHECK_SQL = "select filename, pid, count(*) c from latest_results group by filename, pid having c > 1"
+
+
+def to_markdown(table) -> str:
+    """Render an Arrow table as an aligned markdown pipe table; values are already rounded in SQL"""
+    # Arrow casts each column to strings in one call, nulls render as empty cells
+    columns = [
+        [cell or "" for cell in pc.cast(column, pa.string()).to_pylist()]
+        for column in table.columns
+    ]
+    names = table.schema.names
+    widths = [max([len(name), 3, *map(len, cells)]) for name, cells in zip(names, columns)]
+
+    lines = [
+        "| " + " | ".join(name.ljust(width) for name, width in zip(names, widths)) + " |",
+        "|" + "|".join("-" * (width + 2) for width in widths) + "|",
+    ]
+    for row in zip(*columns):
+        lines.append("| " + " | ".join(cell.ljust(width) for cell, width in zip(row, widths)) + " |")
+    return "\n".join(lines)
+
+
+def main():
+    results_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("benchmark-results")
 
     with bareduckdb.connect() as conn:
-        df = conn.execute(query).df()
+        conn.execute(LOAD_SQL, parameters={"results_glob": str(results_dir / "*.jsonl")})
+        results = conn.execute(REPORT_SQL).arrow_table()
 
-        df_check = conn.execute("select filename, pid, count(*) c from latest_results group by filename, pid having c > 1").df()
+        duplicates = conn.execute(CHECK_SQL).arrow_table()
 
     print("## Benchmark Results\n")
-    print(df.to_markdown(index=False))
+    print(to_markdown(results))
     print("\n_time_ratio < 1 means bareduckdb is faster_")
 
-    if len(df_check) > 0:
+    if duplicates.num_rows > 0:
         print("\n**WARNING: Fork isolation issue detected!** Multiple tests ran in same process:\n")
-        print(df_check.to_markdown(index=False))
+        print(to_markdown(duplicates))
 
 
 if __name__ == "__main__":
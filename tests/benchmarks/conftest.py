@@ -1,3 +1,4 @@
+import functools
 import pytest
 import os
 import platform
@@ -24,6 +25,7 @@ _MAXRSS_DIVISOR = 1024 if platform.system() == "Darwin" else 1
 
 # Module-level state for library info (set once per session)
 _lib_info = {}
+_lib_module = None  # duckdb or bareduckdb, imported once before tests fork
 _output_file = None
 
 BENCHMARK_OUTPUT_DIR = Path("benchmark-results")
@@ -60,23 +62,18 @@ def pytest_generate_tests(metafunc):
 def pytest_configure(config):
     """Set up library info and output file once at session start."""
 
-    # TODO: Think about allowing parallel tasks - maybe file locking
-    global _output_file
+    global _output_file, _lib_module
 
     use_duckdb = config.getoption("--use-duckdb")
 
     if use_duckdb:
-        import duckdb
-
-        conn = duckdb.connect()
-        _lib_info["library"] = "duckdb"
-        _lib_info["lib_version"] = duckdb.__version__
+        import duckdb as _lib_module
     else:
-        import bareduckdb
+        import bareduckdb as _lib_module
 
-        conn = bareduckdb.connect()
-        _lib_info["library"] = "bareduckdb"
-        _lib_info["lib_version"] = bareduckdb.__version__
+    conn = _lib_module.connect()
+    _lib_info["library"] = _lib_module.__name__
+    _lib_info["lib_version"] = _lib_module.__version__
 
     result = conn.execute("PRAGMA version").fetchone()
     _lib_info["duckdb_version"] = result[0] if result else "unknown"
@@ -84,18 +81,33 @@ def pytest_configure(config):
 
     # Create output file with timestamp
     BENCHMARK_OUTPUT_DIR.mkdir(exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        # xdist worker: reuse the controller's run timestamp, so all workers' files group as one run
+        timestamp = workerinput["benchmark_timestamp"]
+        worker_part = f"_{workerinput['workerid']}"
+    else:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        worker_part = ""
+    _lib_info["run_timestamp"] = timestamp
     library = _lib_info["library"]
     suffix = config.getoption("--benchmark-suffix")
     global BENCHMARK_SUFFIX
     BENCHMARK_SUFFIX = suffix
 
     suffix_part = f"-{suffix}" if suffix else ""
-    filename = BENCHMARK_OUTPUT_DIR / f"benchmark_{library}{suffix_part}_{timestamp}.jsonl"
+    # One file per xdist worker instead of locking a shared one
+    filename = BENCHMARK_OUTPUT_DIR / f"benchmark_{library}{suffix_part}_{timestamp}{worker_part}.jsonl"
     _output_file = open(filename, "w")
     _lib_info["output_file"] = str(filename)
 
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """xdist controller hook: hand the controller's run timestamp to each worker."""
+    node.workerinput["benchmark_timestamp"] = _lib_info["run_timestamp"]
+
+
 def pytest_unconfigure(config):
     global _output_file
     if _output_file:
@@ -103,6 +115,22 @@ def pytest_unconfigure(config):
         _output_file = None
 
 
+@functools.cache
+def _sql_path_test_name(sql_path) -> str | None:
+    """e.g., "tests/benchmarks/cases/filters/string_comparison.sql" -> "filters_string_comparison"; None if not a case file"""
+    sql_path_obj = Path(sql_path)
+    try:
+        if "tests/benchmarks/cases" in str(sql_path_obj):
+            parts = sql_path_obj.parts
+            cases_idx = parts.index("cases")
+            path_parts = list(parts[cases_idx + 1:])
+            path_parts[-1] = Path(path_parts[-1]).stem
+            return "_".join(path_parts)
+    except (ValueError, IndexError):
+        pass  # Keep the default test name if parsing fails
+    return None
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_call(item):
     if not item.get_closest_marker("benchmark"):
@@ -151,18 +179,7 @@ def pytest_runtest_call(item):
         sql_path = params.get("sql_path")
 
         if sql_path:
-            # e.g., "tests/benchmarks/cases/filters/string_comparison.sql" -> "filters_string_comparison"
-            sql_path_obj = Path(sql_path)
-            try:
-                if "tests/benchmarks/cases" in str(sql_path_obj):
-                    parts = sql_path_obj.parts
-                    cases_idx = parts.index("cases")
-                    path_parts = parts[cases_idx + 1:]
-                    path_parts = list(path_parts)
-                    path_parts[-1] = Path(path_parts[-1]).stem
-                    test_name = "_".join(path_parts)
-            except (ValueError, IndexError):
-                pass  # Keep the default test name if parsing fails
+            test_name = _sql_path_test_name(sql_path) or test_name
 
         test_id = item.callspec.id
         if test_id:
@@ -191,7 +208,6 @@ def pytest_runtest_call(item):
         **{f"rusage_{k}": v for k, v in rusage_delta.items()},
     }
 
-    # TODO: Consider adding filelock to allow parallel tests
     if _output_file:
         _output_file.write(json.dumps(result) + "\n")
         _output_file.flush()
@@ -236,17 +252,8 @@ def registered_tables(conn, request):
 
 
 @pytest.fixture
-def conn_with_like_data(request, ensure_parquet_files):
-    use_duckdb = request.config.getoption("--use-duckdb")
-
-    if use_duckdb:
-        import duckdb
-
-        connection = duckdb.connect()
-    else:
-        import bareduckdb
-
-        connection = bareduckdb.connect()
+def conn_with_like_data(ensure_parquet_files):
+    connection = _lib_module.connect()
 
     connection.execute("CREATE TABLE t1 AS SELECT * FROM 'testdata/t1.parquet'")
     connection.execute("CREATE TABLE t2 AS SELECT * FROM 'testdata/t2.parquet'")
@@ -256,18 +263,9 @@ def conn_with_like_data(request, ensure_parquet_files):
 
 
 @pytest.fixture
-def conn(request):
+def conn():
     """Basic connection fixture."""
-    use_duckdb = request.config.getoption("--use-duckdb")
-
-    if use_duckdb:
-        import duckdb
-
-        connection = duckdb.connect()
-    else:
-        import bareduckdb
-
-        connection = bareduckdb.connect()
+    connection = _lib_module.connect()
 
     # Warm the connection
     _ = connection.execute("select * from range(10)").fetch_arrow_table()
@@ -277,18 +275,9 @@ def conn(request):
 
 
 @pytest.fixture
-def conne(request):
+def conne():
     """Connection execute method fixture."""
-    use_duckdb = request.config.getoption("--use-duckdb")
-
-    if use_duckdb:
-        import duckdb
-
-        connection = duckdb.connect()
-    else:
-        import bareduckdb
-
-        connection = bareduckdb.connect()
+    connection = _lib_module.connect()
 
     # Warm the connection
     _ = connection.execute("select * from range(10)").fetch_arrow_table()
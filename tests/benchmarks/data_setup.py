@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+import functools
+import hashlib
 import re
 from pathlib import Path
 
@@ -14,11 +16,14 @@ DATA_FILE_MAP = {
 }
 
 
+# Quoted paths and a single alternation, so substitution is one pass over the SQL
+_QUOTED_DATA_FILES = {placeholder: f"'{filepath}'" for placeholder, filepath in DATA_FILE_MAP.items()}
+_PLACEHOLDER_RE = re.compile("|".join(map(re.escape, DATA_FILE_MAP)))
+
+
 def replace_data_placeholders(sql: str) -> str:
     """Replace DATA_* placeholders with actual file paths."""
-    for placeholder, filepath in DATA_FILE_MAP.items():
-        sql = sql.replace(placeholder, f"'{filepath}'")
-    return sql
+    return _PLACEHOLDER_RE.sub(lambda m: _QUOTED_DATA_FILES[m.group(0)], sql)
 
 
 def load_data_by_mode(filepath: Path, mode: str):
@@ -60,9 +65,11 @@ def rewrite_sql_for_registration(sql: str, mode: str) -> tuple[str, dict[str, Pa
     return sql, tables_to_register
 
 
+@functools.cache
 def parse_sql_case(path: Path, replace_placeholders: bool = True) -> tuple[str, str | None]:
     """Parse SQL file, return (sql, expected_len expression or None).
 
+    Cached: the registered_tables fixture and the test body both parse the same case.
     """
     content = path.read_text()
     lines = content.strip().split("\n")
@@ -136,27 +143,42 @@ PARQUET_DEFINITIONS = {
 }
 
 
-def setup_data(data_dir: Path | None = None, force: bool = False):
-    try:
-        import bareduckdb as db
-    except ImportError:
-        import duckdb as db
+# zstd at a low level: smaller files than the snappy default at similar decode speed
+PARQUET_COPY_OPTIONS = "FORMAT PARQUET, COMPRESSION ZSTD, COMPRESSION_LEVEL 1"
 
+
+def setup_data(data_dir: Path | None = None, force: bool = False):
     if data_dir is None:
         data_dir = DATA_DIR
 
     data_dir.mkdir(exist_ok=True)
 
-    with db.connect() as conn:
-        for filename, query in PARQUET_DEFINITIONS.items():
-            filepath = data_dir / filename
+    stale = []
+    for filename, query in PARQUET_DEFINITIONS.items():
+        filepath = data_dir / filename
+        # Sidecar hash of the definition, so edited queries or options regenerate stale files
+        hashfile = filepath.with_name(filepath.name + ".hash")
+        definition_hash = hashlib.sha256(f"{query}\n{PARQUET_COPY_OPTIONS}".encode()).hexdigest()
+
+        if not force and filepath.exists() and hashfile.exists() and hashfile.read_text() == definition_hash:
+            continue
+        stale.append((filepath, hashfile, definition_hash, query))
+
+    # Fixtures call this before every test: only import and connect when something needs writing
+    if not stale:
+        return
 
-            if filepath.exists() and not force:
-                continue
+    try:
+        import bareduckdb as db
+    except ImportError:
+        import duckdb as db
 
+    with db.connect() as conn:
+        for filepath, hashfile, definition_hash, query in stale:
             print(f"Creating {filepath}...")
 
-            conn.execute(f"COPY ({query}) TO '{filepath}' (FORMAT PARQUET)")
+            conn.execute(f"COPY ({query}) TO '{filepath}' ({PARQUET_COPY_OPTIONS})")
+            hashfile.write_text(definition_hash)
 
 
 def clean_data(data_dir: Path | None = None):
@@ -169,6 +191,7 @@ def clean_data(data_dir: Path | None = None):
         if filepath.exists():
             print(f"Removing {filepath}")
             filepath.unlink()
+        filepath.with_name(filepath.name + ".hash").unlink(missing_ok=True)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 """Helper utilities for DuckDB/BareDuckDB comparison tests."""
 
+import functools
 import tempfile
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
@@ -12,7 +13,9 @@ duckdb = pytest.importorskip("duckdb")
 pa = pytest.importorskip("pyarrow")
 pq = pytest.importorskip("pyarrow.parquet")
 
+@functools.cache
 def create_comprehensive_arrow_table() -> pa.Table:
+    # Built once: Arrow tables are immutable, so every caller can share the same one
     data = {}
 
     # Primitives
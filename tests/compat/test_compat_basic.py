@@ -56,3 +56,35 @@ def test_fetch():
         assert len(result) == 2
         assert result[-1] == (1,)
             
+
+
+def test_fetch_without_result():
+    conn = bareduckdb.connect()
+
+    with pytest.raises(RuntimeError, match="No last result"):
+        conn.fetchone()
+    with pytest.raises(RuntimeError, match="No last result"):
+        conn.description
+
+    conn.execute("select 1")
+    conn.close()
+
+    with pytest.raises(RuntimeError, match="No last result"):
+        conn.fetchall()
+
+
+def test_pl_repeated():
+    pytest.importorskip("polars")
+
+    with bareduckdb.connect() as conn:
+        conn.execute("select * from range(10) t(i)", output_type="arrow_reader")
+
+        first = conn.pl()
+        # The reader can only be consumed once; the second call reuses the converted frame
+        second = conn.pl()
+        assert first.equals(second)
+        assert second.height == 10
+
+        # Each call gets its own frame, so in-place changes don't leak into the next one
+        first.columns = ["renamed"]
+        assert conn.pl().columns == ["i"]
@@ -35,6 +35,18 @@ class TestAppenderBasic:
         assert result == [(1, "a"), (2, "b"), (3, "c")]
         conn.close()
 
+    def test_appender_append_row_tuple(self):
+        conn = Connection()
+        conn.execute("CREATE TABLE test_table (id INTEGER, name VARCHAR)")
+
+        with conn.appender("test_table") as app:
+            for row in [(1, "a"), (2, "b")]:
+                assert app.append_row_tuple(row) is None
+
+        result = conn.execute("SELECT * FROM test_table ORDER BY id").fetchall()
+        assert result == [(1, "a"), (2, "b")]
+        conn.close()
+
     def test_appender_explicit_lifecycle(self):
         conn = Connection()
         conn.execute("CREATE TABLE test_table (id INTEGER)")
@@ -320,3 +332,56 @@ class TestAppenderLargeData:
         result = conn.execute("SELECT COUNT(*) FROM test_table").fetchone()
         assert result[0] == 2000
         conn.close()
+
+    def test_appender_append_arrow(self):
+        pa = pytest.importorskip("pyarrow")
+        conn = Connection()
+        conn.execute("CREATE TABLE test_table (id INTEGER, name VARCHAR)")
+
+        with conn.appender("test_table") as app:
+            app.append_row(0, "first")
+            app.append_arrow(pa.table({"id": list(range(1, 2001)), "name": ["x"] * 2000}))
+            app.append_row(2001, "last")
+
+        result = conn.execute("SELECT COUNT(*), MIN(id), MAX(id) FROM test_table").fetchone()
+        assert result == (2002, 0, 2001)
+        conn.close()
+
+    def test_appender_append_arrow_skips_statistics(self, monkeypatch):
+        pa = pytest.importorskip("pyarrow")
+        conn = Connection(default_statistics="numeric")
+        conn.execute("CREATE TABLE test_table (id INTEGER)")
+
+        seen = []
+        register_arrow = conn._register_arrow
+
+        def spy(name, data, statistics=None):
+            seen.append(statistics)
+            return register_arrow(name, data, statistics=statistics)
+
+        monkeypatch.setattr(conn, "_register_arrow", spy)
+
+        with conn.appender("test_table") as app:
+            app.append_arrow(pa.table({"id": [1, 2, 3]}))
+
+        # The one-shot INSERT source is registered without min/max statistics
+        assert seen == [False]
+        assert conn.execute("SELECT COUNT(*) FROM test_table").fetchone() == (3,)
+        conn.close()
+
+    def test_appender_append_arrow_catalog_without_schema(self):
+        pa = pytest.importorskip("pyarrow")
+        conn = Connection()
+        conn.execute("ATTACH ':memory:' AS other")
+        conn.execute("CREATE TABLE other.main.test_table (id INTEGER)")
+        # A same-named schema in the default catalog would capture a two-part "other"."test_table"
+        conn.execute("CREATE SCHEMA memory.other")
+        conn.execute("CREATE TABLE memory.other.test_table (id INTEGER)")
+
+        with conn.appender("test_table", catalog="other") as app:
+            app.append_row(1)
+            app.append_arrow(pa.table({"id": [2, 3]}))
+
+        assert conn.execute("SELECT COUNT(*) FROM other.main.test_table").fetchone() == (3,)
+        assert conn.execute("SELECT COUNT(*) FROM memory.other.test_table").fetchone() == (0,)
+        conn.close()
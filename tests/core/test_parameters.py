@@ -22,4 +22,18 @@ def test_core_named_parameters():
         assert(result.to_pylist()[-1]["i"] == 6)
 
 
+def test_core_repeated_parameters():
+    with ConnectionBase(database=":memory:") as conn:
+        query = "select count(*) as cnt from t where i < ?"
+        conn._call(query="create table t as select * from range(10) t(i)", output_type="arrow_table")
+
+        # Same query text reuses the prepared statement, with new values and types
+        assert conn._call(query=query, output_type="arrow_table", parameters=[3]).to_pylist() == [{"cnt": 3}]
+        assert conn._call(query=query, output_type="arrow_table", parameters=[5.5]).to_pylist() == [{"cnt": 6}]
+
+        # Schema changes force DuckDB to rebind the cached statement
+        conn._call(query="create or replace table t as select * from range(100) t(i)", output_type="arrow_table")
+        assert conn._call(query=query, output_type="arrow_table", parameters=[50]).to_pylist() == [{"cnt": 50}]
+
+
 test_core_named_parameters()
\ No newline at end of file
@@ -94,3 +94,32 @@ def test_lazyframe_aggregation():
     ).fetchall()
     assert result == [("x", 3), ("y", 12)]
     conn.close()
+
+
+def test_lazyframe_repeated_filters():
+    lf = pl.DataFrame({
+        "id": list(range(100)),
+        "value": [i * 10 for i in range(100)],
+    }).lazy()
+
+    conn = Connection()
+    conn.register("data", lf)
+
+    # Repeated filters reuse the translated expression; a changed value must not
+    assert conn.execute("SELECT COUNT(*) FROM data WHERE id > 90").fetchone()[0] == 9
+    assert conn.execute("SELECT COUNT(*) FROM data WHERE id > 90").fetchone()[0] == 9
+    assert conn.execute("SELECT COUNT(*) FROM data WHERE id > 95").fetchone()[0] == 4
+    conn.close()
+
+
+def test_lazyframe_in_memory_plan():
+    df = pl.DataFrame({"id": list(range(10)), "name": [f"n{i}" for i in range(10)]})
+
+    conn = Connection()
+    conn.register("plain", df.lazy())  # collected once at registration
+    conn.register("planned", df.lazy().filter(pl.col("id") % 2 == 0))  # stays lazy
+
+    assert conn.execute("SELECT COUNT(*) FROM plain WHERE id >= 5").fetchone()[0] == 5
+    assert conn.execute("SELECT name FROM plain WHERE id = 3").fetchall() == [("n3",)]
+    assert conn.execute("SELECT COUNT(*) FROM planned WHERE id >= 5").fetchone()[0] == 2
+    conn.close()
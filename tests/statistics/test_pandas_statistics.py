@@ -40,3 +40,17 @@ def test_pandas_vs_pyarrow_registration():
     conn2.close()
 
     assert result1 == result2 == (499,)
+
+
+def test_pandas_float_nan_is_not_null():
+    import bareduckdb
+
+    df = pd.DataFrame({'b': [1.5, None, 2.0]})
+
+    conn = bareduckdb.connect()
+    conn.register('nan_table', df)
+    result = conn.execute("SELECT count(b), count(*) FILTER (WHERE isnan(b)) FROM nan_table").fetchone()
+    conn.close()
+
+    # numpy NaN registers as a NaN value, not as NULL
+    assert result == (3, 1)
@@ -92,3 +92,56 @@ def test_replacement_scan_non_arrow_object(thread_index, iteration_index):
         conn.execute("SELECT * FROM my_table")
 
     conn.close()
+
+
+def test_replacement_scan_sees_new_tables(thread_index, iteration_index):
+    conn = bareduckdb.connect(
+        database=f":memory:repl_ddl_{thread_index}_{iteration_index}",
+        enable_replacement_scan=True
+    )
+    my_data = pa.table({"a": [1, 2, 3]})
+
+    assert conn.execute("SELECT COUNT(*) AS cnt FROM my_data").arrow_table()["cnt"].to_pylist() == [3]
+
+    # The cached table list must be refreshed after DDL, so the real table wins over the local variable
+    conn.execute("CREATE TABLE my_data AS SELECT 42 AS a")
+    assert conn.execute("SELECT a FROM my_data").arrow_table()["a"].to_pylist() == [42]
+
+    conn.execute("DROP TABLE my_data")
+    assert conn.execute("SELECT COUNT(*) AS cnt FROM my_data").arrow_table()["cnt"].to_pylist() == [3]
+    conn.close()
+
+
+def test_replacement_scan_sees_tables_created_by_cursor(thread_index, iteration_index):
+    conn = bareduckdb.connect(
+        database=f":memory:repl_cursor_ddl_{thread_index}_{iteration_index}",
+        enable_replacement_scan=True
+    )
+    my_data = pa.table({"a": [1, 2, 3]})
+
+    # Populates the parent's cached table list without my_data in it
+    assert conn.execute("SELECT COUNT(*) AS cnt FROM my_data").arrow_table()["cnt"].to_pylist() == [3]
+
+    # DDL through a cursor shares the database, so the parent's cached list must expire too
+    cursor = conn.cursor()
+    cursor.execute("CREATE TABLE my_data AS SELECT 42 AS a")
+    assert conn.execute("SELECT a FROM my_data").arrow_table()["a"].to_pylist() == [42]
+
+    cursor.execute("DROP TABLE my_data")
+    assert conn.execute("SELECT COUNT(*) AS cnt FROM my_data").arrow_table()["cnt"].to_pylist() == [3]
+    conn.close()
+
+
+def test_replacement_scan_ignores_library_names(thread_index, iteration_index):
+    conn = bareduckdb.connect(
+        database=f":memory:repl_shadow_{thread_index}_{iteration_index}",
+        enable_replacement_scan=True
+    )
+    # Both names are also module globals inside bareduckdb: the caller's tables must win
+    logger = pa.table({"a": [1, 2]})
+    itertools = pa.table({"b": [3]})
+
+    result = conn.execute("SELECT a, b FROM logger, itertools ORDER BY a").arrow_table()
+
+    assert result.to_pylist() == [{"a": 1, "b": 3}, {"a": 2, "b": 3}]
+    conn.close()
@@ -78,6 +78,21 @@ def test_udtf_with_conn_injection(thread_index, iteration_index):
     conn.close()
 
 
+def test_udtf_wants_conn_override(thread_index, iteration_index):
+    conn = bareduckdb.connect(database=f":memory:udtf_wants_conn_{thread_index}_{iteration_index}")
+
+    def wrapper(*args, **kwargs) -> pa.Table:
+        assert kwargs["conn"] is conn
+        return pa.table({"n": [args[0]]})
+
+    conn.register_udtf("wrapper", wrapper, wants_conn=True)
+
+    result = conn.execute("SELECT * FROM wrapper(7)").arrow_table()
+    assert result["n"].to_pylist() == [7]
+
+    conn.close()
+
+
 def test_udtf_multiple_calls(thread_index, iteration_index):
 
     conn = bareduckdb.connect(database=f":memory:udtf_multi_{thread_index}_{iteration_index}")
@@ -197,11 +212,11 @@ def test_udtf_unique_naming(thread_index, iteration_index):
 
     sql = "SELECT COUNT(*) as cnt FROM test_func(10)"
 
-    # Process same SQL twice - should get different table names (UUID-based)
+    # Process same SQL twice - should get different table names
     sql1, data1 = conn._preprocess(sql, None)
     sql2, data2 = conn._preprocess(sql, None)
 
-    # Table names should be different (UUID ensures uniqueness)
+    # Table names should be different (monotonic counter ensures uniqueness)
     assert sql1 != sql2, "Different UDTF calls should generate different table names"
     assert list(data1.keys()) != list(data2.keys())
 
@@ -246,3 +261,23 @@ def test_udtf_with_data_param(thread_index, iteration_index):
 
     conn.close()
 
+
+
+def test_udtf_repeated_query(thread_index, iteration_index):
+    conn = bareduckdb.connect(database=f":memory:udtf_repeat_{thread_index}_{iteration_index}")
+
+    calls = []
+
+    def gen_data(n: int) -> pa.Table:
+        calls.append(n)
+        return pa.table({"x": range(n)})
+
+    conn.register_udtf("gen_data", gen_data)
+
+    for _ in range(3):
+        result = conn.execute("SELECT COUNT(*) AS cnt FROM gen_data(4)").arrow_table()
+        assert result["cnt"].to_pylist() == [4]
+
+    # The parse is cached, but the UDTF still runs on every execute
+    assert calls == [4, 4, 4]
+    conn.close()
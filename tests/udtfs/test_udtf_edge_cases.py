@@ -115,3 +115,21 @@ def test_udtf_with_only_named_parameters(thread_index, iteration_index):
     assert result["id"].to_pylist() == [10, 11, 12]
     assert result["value"].to_pylist() == [0, 2, 4]
     conn.close()
+
+
+def test_udtf_call_text_not_normalized(thread_index, iteration_index):
+    conn = bareduckdb.connect(database=f":memory:udtf_spacing_{thread_index}_{iteration_index}")
+
+    def gen_data(rows: int, label: str = "x") -> pa.Table:
+        return pa.table({"id": range(rows), "label": [label] * rows})
+
+    conn.register_udtf("gen_data", gen_data)
+
+    # Spacing and literals that mention the call must not break the rewrite
+    result = conn.execute(
+        "SELECT label, 'gen_data(2)' AS note FROM gen_data( 2,\n  label := 'a, b' )"
+    ).arrow_table()
+
+    assert result["label"].to_pylist() == ["a, b", "a, b"]
+    assert result["note"].to_pylist() == ["gen_data(2)", "gen_data(2)"]
+    conn.close()